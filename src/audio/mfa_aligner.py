@@ -34,6 +34,15 @@ import re
 
 logger = logging.getLogger(__name__)
 
+# TextGrid interval entry: intervals [N]: xmin = X xmax = Y text = "word"
+_INTERVAL_RE = re.compile(
+    r'intervals\s*\[\d+\]:\s*'
+    r'xmin\s*=\s*([\d.]+)\s*'
+    r'xmax\s*=\s*([\d.]+)\s*'
+    r'text\s*=\s*"([^"]*)"',
+    re.DOTALL
+)
+
 
 class MFANotAvailableError(Exception):
     """Raised when MFA is not installed or not found in PATH."""
@@ -253,16 +262,7 @@ class MFAAligner:
             words_tier = tiers[-1] if tiers else ""
 
         # Parse intervals in the words tier
-        # Pattern: intervals [N]: xmin = X xmax = Y text = "word"
-        interval_pattern = re.compile(
-            r'intervals\s*\[\d+\]:\s*'
-            r'xmin\s*=\s*([\d.]+)\s*'
-            r'xmax\s*=\s*([\d.]+)\s*'
-            r'text\s*=\s*"([^"]*)"',
-            re.DOTALL
-        )
-
-        for match in interval_pattern.finditer(words_tier):
+        for match in _INTERVAL_RE.finditer(words_tier):
             xmin = float(match.group(1))
             xmax = float(match.group(2))
             text = match.group(3).strip()
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import List, Dict
 from ..utils.logger import get_logger
 from ..utils.progress import create_progress_bar
+from ..utils.transcript_html import render_segment_row
 
 logger = get_logger(__name__)
 
@@ -23,11 +24,14 @@ class DatasetPackager:
         self.output_dir = Path(output_dir)
         self.audio_dir = self.output_dir / "audio" / "train"
         self.transcript_dir = self.output_dir / "transcripts_deid" / "train"
+        self.transcript_meta_dir = self.output_dir / "transcripts_deid" / "meta"
+        self.transcript_html_dir = self.output_dir / "transcripts_deid" / "html"
         self.metadata_dir = self.output_dir / "metadata"
         self.qa_dir = self.output_dir / "qa"
 
         # Create directories
-        for directory in [self.audio_dir, self.transcript_dir, self.metadata_dir, self.qa_dir]:
+        for directory in [self.audio_dir, self.transcript_dir, self.transcript_meta_dir,
+                          self.transcript_html_dir, self.metadata_dir, self.qa_dir]:
             directory.mkdir(parents=True, exist_ok=True)
 
         logger.info(f"Initialized DatasetPackager with output: {self.output_dir}")
@@ -61,9 +65,50 @@ class DatasetPackager:
         transcript_dest = self.transcript_dir / f"{conversation_id}.json"
         with open(transcript_dest, 'w') as f:
             json.dump(transcript_data, f, indent=2)
+        self._save_transcript_meta(conversation_id, transcript_data)
+        self._save_transcript_html(conversation_id, transcript_data)
 
         logger.debug(f"Transcript packaged: {transcript_dest.name}")
 
+    def _save_transcript_meta(self, conversation_id: str, transcript_data: Dict):
+        """
+        Save a small metadata sidecar next to the transcript.
+
+        Lets viewers show conversation headers without parsing full transcripts.
+
+        Args:
+            conversation_id: Conversation identifier
+            transcript_data: De-identified transcript dictionary
+        """
+        segments = transcript_data.get('segments', [])
+        meta = {
+            'conversation_id': conversation_id,
+            'num_segments': len(segments),
+            'num_speakers': len(set(seg.get('speaker', 'Unknown') for seg in segments)),
+            'total_pii_found': transcript_data.get('pii_summary', {}).get('total_pii_found', 0)
+        }
+
+        meta_dest = self.transcript_meta_dir / f"{conversation_id}.json"
+        with open(meta_dest, 'w') as f:
+            json.dump(meta, f)
+
+    def _save_transcript_html(self, conversation_id: str, transcript_data: Dict):
+        """
+        Save pre-rendered transcript table rows, one <tr> per line.
+
+        Lets viewers page through highlighted transcripts without re-rendering them.
+
+        Args:
+            conversation_id: Conversation identifier
+            transcript_data: De-identified transcript dictionary
+        """
+        html_dest = self.transcript_html_dir / f"{conversation_id}.html"
+        with open(html_dest, 'w', encoding='utf-8') as f:
+            f.writelines(
+                render_segment_row(seg) + '\n'
+                for seg in transcript_data.get('segments', [])
+            )
+
     def package_dataset(
         self,
         conversations: List[Dict],
@@ -91,6 +136,8 @@ class DatasetPackager:
             transcript_dest = self.transcript_dir / f"{conv_id}.json"
             with open(transcript_dest, 'w') as f:
                 json.dump(conv, f, indent=2)
+            self._save_transcript_meta(conv_id, conv)
+            self._save_transcript_html(conv_id, conv)
             logger.debug(f"Transcript packaged: {transcript_dest.name}")
 
             # Save audio if available
@@ -125,6 +172,8 @@ with PII (Personally Identifiable Information) removed.
 
 - `audio/train/` - {dataset_stats['total_conversations']} de-identified audio files (FLAC format)
 - `transcripts_deid/train/` - {dataset_stats['total_conversations']} de-identified transcripts (JSON format)
+- `transcripts_deid/meta/` - Per-transcript header metadata sidecars (segment, speaker and PII counts; JSON)
+- `transcripts_deid/html/` - Pre-rendered transcript table rows for the viewer (one `<tr>` per segment per line)
 - `metadata/` - Dataset metadata (Parquet format)
 - `qa/` - Quality assurance reports
 
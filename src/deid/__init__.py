@@ -1,7 +1,7 @@
 """De-identification module for PII detection and removal."""
 
 from .config_loader import ConfigLoader
-from .pii_detector import PIIDetector, PIIMatch
+from .pii_detector import PIIDetector, PIIMatch, get_detector
 from .text_redactor import TextRedactor
 
-__all__ = ['ConfigLoader', 'PIIDetector', 'PIIMatch', 'TextRedactor']
+__all__ = ['ConfigLoader', 'PIIDetector', 'PIIMatch', 'TextRedactor', 'get_detector']
@@ -1,14 +1,38 @@
 """Detect PII in text using pattern matching."""
 
 import re
+import string
+import sys
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import List, Dict
 from dataclasses import dataclass
 from .config_loader import ConfigLoader
 from ..utils.logger import get_logger
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import regex
+    REGEX_AVAILABLE = True
+except ImportError:
+    REGEX_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+# ASCII characters matched by \w, for word-boundary checks outside re
+_WORD_CHARS = frozenset(string.ascii_letters + string.digits + '_')
+
 
 @dataclass
 class PIIMatch:
@@ -33,20 +57,47 @@ class PIIMatch:
 class PIIDetector:
     """Detects PII in text using regex pattern matching."""
 
-    def __init__(self, config_path: Path = Path("config.yaml")):
+    def __init__(self, config_path: Path = Path("config.yaml"), backend: str = "re"):
         """
         Initialize PII detector.
 
         Args:
             config_path: Path to config.yaml file
+            backend: Engine to scan with: "re" (default), "regex", "hyperscan" or
+                     "ahocorasick" (falls back to "re" if the engine is not installed)
         """
+        if backend not in ("re", "regex", "hyperscan", "ahocorasick"):
+            raise ValueError(f"Unknown PII detector backend: {backend}")
+
+        if backend == "hyperscan" and not HYPERSCAN_AVAILABLE:
+            logger.warning("hyperscan not installed, falling back to re backend")
+            backend = "re"
+
+        if backend == "regex" and not REGEX_AVAILABLE:
+            logger.warning("regex not installed, falling back to re backend")
+            backend = "re"
+
+        if backend == "ahocorasick" and not AHOCORASICK_AVAILABLE:
+            logger.warning("pyahocorasick not installed, falling back to re backend")
+            backend = "re"
+
+        self.backend = backend
         self.config_loader = ConfigLoader(config_path)
-        self.patterns = {}
         self._compile_patterns()
-        logger.info(f"Initialized PIIDetector with {len(self.patterns)} categories")
+
+        if self.backend == "hyperscan":
+            self._compile_hyperscan()
+        elif self.backend == "ahocorasick":
+            self._compile_ahocorasick()
+
+        logger.info(f"Initialized PIIDetector with {len(self._categories)} categories "
+                   f"({self.backend} backend)")
 
     def _compile_patterns(self):
-        """Compile regex patterns for each PII category."""
+        """Compile one combined regex pattern covering every PII category."""
+        categories = []
+        alternations = []
+
         for category_name, category_data in self.config_loader.get_all_categories().items():
             items = self.config_loader.get_category_items(category_name)
 
@@ -56,14 +107,143 @@ class PIIDetector:
             # Sort by length (longest first) to match longer items first
             items_sorted = sorted(items, key=len, reverse=True)
 
-            # Escape special regex characters and create pattern with word boundaries
-            escaped_items = [re.escape(item) for item in items_sorted]
-            pattern = r'\b(' + '|'.join(escaped_items) + r')\b'
+            categories.append(category_name)
+            # Escape special regex characters
+            alternations.append('|'.join(re.escape(item) for item in items_sorted))
+
+            logger.debug(f"Added {category_name} with {len(items)} items to the combined pattern")
+
+        # All categories in one pattern, one group per category, so each text
+        # is scanned once. An item listed under two categories (e.g. "New York"
+        # as city and state) is reported once, under the first category in
+        # config order.
+        self._categories = tuple(categories)
+        self._alternations = tuple(alternations)
+        # Interned, so every PIIMatch in a category shares one tag string
+        self._tags = tuple(sys.intern(self.config_loader.get_category_tag(c)) for c in self._categories)
+
+        engine = regex if self.backend == "regex" else re
+        self._combined_pattern = engine.compile(
+            r'\b(?:' + '|'.join(f'({alternation})' for alternation in alternations) + r')\b',
+            engine.IGNORECASE
+        ) if alternations else None
+
+    @cached_property
+    def patterns(self) -> Dict[str, re.Pattern]:
+        """
+        Per-category compiled patterns, with word boundaries (case-insensitive).
+
+        Built on first access only; detection itself uses the combined pattern.
+        """
+        return {
+            category_name: re.compile(r'\b(' + alternation + r')\b', re.IGNORECASE)
+            for category_name, alternation in zip(self._categories, self._alternations)
+        }
+
+    def _compile_hyperscan(self):
+        """
+        Compile every category item into a single Hyperscan database.
+
+        One expression per item rather than per category: with
+        HS_FLAG_SOM_LEFTMOST Hyperscan reports only the leftmost start for
+        each match end, which would hide a shorter item ending at the same
+        place (e.g. "York" inside "New York").
+        """
+        expressions = []
+        self._hs_item_categories = []
+        for i, category_name in enumerate(self._categories):
+            for item in self.config_loader.get_category_items(category_name):
+                expressions.append((r'\b' + re.escape(item) + r'\b').encode())
+                self._hs_item_categories.append(i)
+
+        num_patterns = len(expressions)
+        if not num_patterns:
+            self._hs_db = None
+            return
+
+        self._hs_db = hyperscan.Database()
+        self._hs_db.compile(
+            expressions=expressions,
+            ids=list(range(num_patterns)),
+            elements=num_patterns,
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST] * num_patterns
+        )
+        self._hs_scratch = hyperscan.Scratch(self._hs_db)
+
+    def _compile_ahocorasick(self):
+        """Build one Aho-Corasick automaton over the lowercased items of all categories."""
+        self._automaton = ahocorasick.Automaton()
+
+        for i, category_name in enumerate(self._categories):
+            for item in self.config_loader.get_category_items(category_name):
+                key = item.lower()
+                # Items listed under two categories belong to the first one,
+                # as with the combined pattern
+                if key not in self._automaton:
+                    self._automaton.add_word(key, (i, len(key)))
+
+        if len(self._automaton):
+            self._automaton.make_automaton()
+        else:
+            self._automaton = None
+
+    def _resolve_spans(self, text: str, spans: List[tuple]) -> List[PIIMatch]:
+        """
+        Turn overlapping (start, category index, -end) spans into matches.
+
+        Multi-pattern engines report every match, so overlaps are resolved
+        the way re.finditer resolves them on the combined pattern: leftmost
+        start first, then the earlier category (its group comes first in the
+        alternation), then the longest item (items within a category are
+        tried longest first).
+        """
+        matches = []
+        last_end = 0
+        for start, i, neg_end in sorted(spans):
+            end = -neg_end
+            if start < last_end:
+                continue
+            last_end = end
+
+            matches.append(PIIMatch(
+                category=self._categories[i],
+                value=text[start:end],
+                start=start,
+                end=end,
+                tag=self._tags[i]
+            ))
+
+        return matches
+
+    def _detect_hyperscan(self, text: str) -> List[PIIMatch]:
+        """Detect PII in ASCII text with the Hyperscan database."""
+        spans = []
 
-            # Compile pattern (case-insensitive by default)
-            self.patterns[category_name] = re.compile(pattern, re.IGNORECASE)
+        item_categories = self._hs_item_categories
 
-            logger.debug(f"Compiled pattern for {category_name} with {len(items)} items")
+        def on_match(pattern_id, start, end, flags, context):
+            spans.append((start, item_categories[pattern_id], -end))
+
+        self._hs_db.scan(text.encode('ascii'), match_event_handler=on_match,
+                         scratch=self._hs_scratch)
+
+        return self._resolve_spans(text, spans)
+
+    def _detect_ahocorasick(self, text: str) -> List[PIIMatch]:
+        """Detect PII in ASCII text with the Aho-Corasick automaton."""
+        n = len(text)
+        spans = []
+
+        for last, (i, length) in self._automaton.iter(text.lower()):
+            start, end = last - length + 1, last + 1
+            # \b holds where exactly one side of the position is a word character
+            if (start > 0 and text[start - 1] in _WORD_CHARS) == (text[start] in _WORD_CHARS):
+                continue
+            if (text[end - 1] in _WORD_CHARS) == (end < n and text[end] in _WORD_CHARS):
+                continue
+            spans.append((start, i, -end))
+
+        return self._resolve_spans(text, spans)
 
     def detect_in_text(self, text: str) -> List[PIIMatch]:
         """
@@ -75,23 +255,31 @@ class PIIDetector:
         Returns:
             List of PIIMatch objects
         """
-        matches = []
+        # Hyperscan offsets are byte offsets, which only equal character
+        # offsets for ASCII text
+        if self.backend == "hyperscan" and self._hs_db is not None and text.isascii():
+            return self._detect_hyperscan(text)
 
-        for category_name, pattern in self.patterns.items():
-            tag = self.config_loader.get_category_tag(category_name)
+        # str.lower() can change the length of non-ASCII text, which would
+        # shift the automaton's offsets
+        if self.backend == "ahocorasick" and self._automaton is not None and text.isascii():
+            return self._detect_ahocorasick(text)
 
-            for match in pattern.finditer(text):
-                pii_match = PIIMatch(
-                    category=category_name,
-                    value=match.group(0),
-                    start=match.start(),
-                    end=match.end(),
-                    tag=tag
-                )
-                matches.append(pii_match)
+        if self._combined_pattern is None:
+            return []
 
-        # Sort by position
-        matches.sort(key=lambda x: x.start)
+        # finditer yields matches in position order; lastindex is the
+        # (1-based) group of the category that matched
+        matches = []
+        for match in self._combined_pattern.finditer(text):
+            i = match.lastindex - 1
+            matches.append(PIIMatch(
+                category=self._categories[i],
+                value=match.group(0),
+                start=match.start(),
+                end=match.end(),
+                tag=self._tags[i]
+            ))
 
         return matches
 
@@ -114,12 +302,15 @@ class PIIDetector:
 
         results = {}
 
+        # Pull the texts out once; prepare_full_transcript accepts plain strings
+        texts = [segment.text for segment in segments]
+
         # Get segment offsets in full transcript
-        _, segment_offsets = prepare_full_transcript(segments)
+        _, segment_offsets = prepare_full_transcript(texts)
 
-        for i, segment in enumerate(segments):
+        for i, (text, segment_offset) in enumerate(zip(texts, segment_offsets)):
             # Detect PII in this segment (gets local offsets)
-            local_matches = self.detect_in_text(segment.text)
+            local_matches = self.detect_in_text(text)
 
             if local_matches:
                 # Adjust offsets to be global (relative to full transcript)
@@ -128,8 +319,8 @@ class PIIDetector:
                     global_match = PIIMatch(
                         category=match.category,
                         value=match.value,
-                        start=match.start + segment_offsets[i],  # Convert to global offset
-                        end=match.end + segment_offsets[i],
+                        start=match.start + segment_offset,  # Convert to global offset
+                        end=match.end + segment_offset,
                         tag=match.tag
                     )
                     global_matches.append(global_match)
@@ -156,6 +347,29 @@ class PIIDetector:
         return summary
 
 
+@lru_cache(maxsize=None)
+def _cached_detector(config_path: Path, backend: str) -> PIIDetector:
+    """Build one PIIDetector per (config path, backend) pair."""
+    return PIIDetector(config_path, backend)
+
+
+def get_detector(config_path: Path = Path("config.yaml"), backend: str = "re") -> PIIDetector:
+    """
+    Get a shared PIIDetector, compiling its patterns only on first use.
+
+    Detection keeps no per-call state, so callers in the same process
+    (pipeline, verifier, tests) can share one instance.
+
+    Args:
+        config_path: Path to config.yaml file
+        backend: Engine to scan with: "re" (default), "regex", "hyperscan" or "ahocorasick"
+
+    Returns:
+        Cached PIIDetector for this config and backend
+    """
+    return _cached_detector(Path(config_path), backend)
+
+
 def main():
     """Test the PII detector."""
     from ..utils.logger import setup_logger
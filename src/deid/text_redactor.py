@@ -20,7 +20,8 @@ class TextRedactor:
 
         Args:
             text: Original text
-            matches: List of PIIMatch objects (must be sorted by position)
+            matches: List of PIIMatch objects (in any order; a match overlapping
+                     an earlier one is skipped)
 
         Returns:
             Tuple of (redacted_text, replacements_log)
@@ -28,17 +29,20 @@ class TextRedactor:
         if not matches:
             return text, []
 
-        # Sort matches by position (descending) to replace from end to start
-        sorted_matches = sorted(matches, key=lambda x: x.start, reverse=True)
-
         # Track replacements
+        parts = []
         replacements = []
-        redacted = text
+        last_end = 0
+
+        # Copy the text between matches and the tags in one forward pass
+        for match in sorted(matches, key=lambda x: x.start):
+            # Skip a match overlapping one already replaced
+            if match.start < last_end:
+                continue
 
-        # Replace from end to start to preserve positions
-        for match in sorted_matches:
-            # Replace the PII value with its tag
-            redacted = redacted[:match.start] + match.tag + redacted[match.end:]
+            parts.append(text[last_end:match.start])
+            parts.append(match.tag)
+            last_end = match.end
 
             # Log the replacement
             replacements.append({
@@ -48,8 +52,8 @@ class TextRedactor:
                 'position': match.start
             })
 
-        # Reverse replacements list to show chronological order
-        replacements.reverse()
+        parts.append(text[last_end:])
+        redacted = ''.join(parts)
 
         logger.debug(f"Redacted {len(replacements)} PII instances")
 
@@ -116,7 +120,6 @@ class TextRedactor:
 
                 # Log redactions for this segment
                 redaction_log['by_segment'][i] = replacements
-                redaction_log['total_replacements'] += len(replacements)
 
                 # Update category counts
                 for repl in replacements:
@@ -127,6 +130,8 @@ class TextRedactor:
                 # No PII, keep original segment
                 redacted_segments.append(segment)
 
+        redaction_log['total_replacements'] = sum(len(r) for r in redaction_log['by_segment'].values())
+
         logger.info(f"Redacted {redaction_log['total_replacements']} PII instances across {len(pii_matches)} segments")
 
         return redacted_segments, redaction_log
@@ -8,12 +8,12 @@ from typing import Optional
 from .ingestion.downloader import HuggingFaceDownloader
 from .ingestion.organizer import DataOrganizer
 from .parsing.transcript_parser import TranscriptParser
-from .deid.pii_detector import PIIDetector
+from .deid.pii_detector import get_detector
 from .deid.text_redactor import TextRedactor
 from .audio.forced_aligner import ForcedAligner
 from .audio.audio_modifier import AudioModifier
 from .qa.verifier import PIIVerifier
-from .qa.statistics import StatisticsGenerator
+from .qa.statistics import StatisticsGenerator, StreamingStats
 from .qa.spot_checker import SpotChecker
 from .curation.packager import DatasetPackager
 from .curation.metadata_generator import MetadataGenerator
@@ -56,7 +56,7 @@ class PIIDeIdentificationPipeline:
         self.downloader = HuggingFaceDownloader()
         self.organizer = DataOrganizer()
         self.parser = TranscriptParser()
-        self.detector = PIIDetector(config_path)
+        self.detector = get_detector(config_path)
         self.redactor = TextRedactor()
 
         # Initialize forced aligner with MFA config
@@ -281,8 +281,11 @@ class PIIDeIdentificationPipeline:
             verification_results = self.verifier.verify_dataset(deid_conversations)
             logger.info(f"✓ Verification: {verification_results['pass_rate']:.2%} pass rate")
 
-            # Generate statistics
-            dataset_stats = self.stats_generator.generate_dataset_stats(deid_conversations)
+            # Generate statistics from the per-conversation stats collected during verification
+            streaming_stats = StreamingStats(self.stats_generator)
+            for conv_stats in verification_results['conversation_stats']:
+                streaming_stats.add(conv_stats)
+            dataset_stats = streaming_stats.finalize()
             dataset_stats['generated_at'] = datetime.now().isoformat()
             logger.info(f"✓ Generated statistics")
 
@@ -1,6 +1,7 @@
 """Parse transcript files with timestamp format."""
 
 import re
+import sys
 from pathlib import Path
 from typing import List, Optional
 from dataclasses import dataclass
@@ -9,7 +10,7 @@ from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptSegment:
     """Represents a segment of conversation."""
     speaker: str
@@ -114,7 +115,9 @@ class TranscriptParser:
         speaker_match = re.search(self.SPEAKER_PATTERN, chunk)
 
         if speaker_match:
-            speaker = speaker_match.group(1)
+            # Intern speaker IDs so equal speakers share one string object;
+            # the vocabulary is small, so keeping them alive is cheap
+            speaker = sys.intern(speaker_match.group(1))
             # Remove speaker tag from text
             text = re.sub(self.SPEAKER_PATTERN, '', chunk).strip()
         else:
@@ -1,7 +1,7 @@
 """Quality assurance module for verification and statistics."""
 
 from .verifier import PIIVerifier
-from .statistics import StatisticsGenerator
+from .statistics import StatisticsGenerator, StreamingStats
 from .spot_checker import SpotChecker
 
-__all__ = ['PIIVerifier', 'StatisticsGenerator', 'SpotChecker']
+__all__ = ['PIIVerifier', 'StatisticsGenerator', 'StreamingStats', 'SpotChecker']
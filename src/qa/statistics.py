@@ -1,14 +1,51 @@
 """Generate statistics and reports about PII de-identification."""
 
 import json
+from collections import Counter
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def build_conversation_stats(
+    conversation: Dict,
+    total_segments: int,
+    total_duration: float,
+    speakers: set
+) -> Dict:
+    """
+    Assemble one conversation's statistics dictionary from precomputed values.
+
+    Shared by StatisticsGenerator and PIIVerifier.verify_and_stat so both
+    produce the same schema.
+
+    Args:
+        conversation: Conversation dictionary (for its ID, PII summary and redaction log)
+        total_segments: Number of segments
+        total_duration: Conversation duration in seconds
+        speakers: Set of speaker IDs (None and empty IDs are dropped; modified in place)
+
+    Returns:
+        Statistics dictionary
+    """
+    speakers.discard(None)
+    speakers.discard('')
+
+    pii_summary = conversation.get('pii_summary', {})
+    return {
+        'conversation_id': conversation.get('conversation_id'),
+        'total_segments': total_segments,
+        'total_duration': total_duration,
+        'speakers': list(speakers),
+        'pii_found': pii_summary.get('total_pii_found', 0),
+        'pii_by_category': pii_summary.get('categories', {}),
+        'total_replacements': conversation.get('redaction_log', {}).get('total_replacements', 0)
+    }
+
+
 class StatisticsGenerator:
     """Generates statistics about the de-identification process."""
 
@@ -27,39 +64,21 @@ class StatisticsGenerator:
             Statistics dictionary
         """
         segments = conversation.get('segments', [])
-        pii_summary = conversation.get('pii_summary', {})
-        redaction_log = conversation.get('redaction_log', {})
 
-        # Calculate total duration (handle None end_time for last segment)
+        # Segments within a conversation share one shape (dicts or dataclasses),
+        # so pick the accessors once from the first segment
         total_duration = 0
+        speakers = set()
         if segments:
             last_segment = segments[-1]
-            if isinstance(last_segment, dict):
-                # If it's a dict, use get()
-                end_time = last_segment.get('end_time') or last_segment.get('start_time', 0)
-            else:
-                # If it's a dataclass, use attribute access
-                end_time = getattr(last_segment, 'end_time', None) or getattr(last_segment, 'start_time', 0)
-            total_duration = end_time
-
-        # Extract speakers (handle both dict and dataclass)
-        speakers = []
-        for s in segments:
-            if isinstance(s, dict):
-                speakers.append(s.get('speaker'))
+            if isinstance(segments[0], dict):
+                total_duration = last_segment.get('end_time') or last_segment.get('start_time', 0)
+                speakers = {s.get('speaker') for s in segments}
             else:
-                speakers.append(getattr(s, 'speaker', None))
-        speakers = list(set(filter(None, speakers)))
+                total_duration = getattr(last_segment, 'end_time', None) or getattr(last_segment, 'start_time', 0)
+                speakers = {s.speaker for s in segments}
 
-        return {
-            'conversation_id': conversation.get('conversation_id'),
-            'total_segments': len(segments),
-            'total_duration': total_duration,
-            'speakers': speakers,
-            'pii_found': pii_summary.get('total_pii_found', 0),
-            'pii_by_category': pii_summary.get('categories', {}),
-            'total_replacements': redaction_log.get('total_replacements', 0)
-        }
+        return build_conversation_stats(conversation, len(segments), total_duration, speakers)
 
     def generate_dataset_stats(self, conversations: List[Dict]) -> Dict:
         """
@@ -71,29 +90,10 @@ class StatisticsGenerator:
         Returns:
             Dataset statistics dictionary
         """
-        total_pii = 0
-        pii_by_category = {}
-        total_segments = 0
-        total_duration = 0
-
+        streaming_stats = StreamingStats(self)
         for conv in conversations:
-            stats = self.generate_conversation_stats(conv)
-            total_pii += stats['pii_found']
-            total_segments += stats['total_segments']
-            total_duration += stats['total_duration']
-
-            # Aggregate category counts
-            for category, count in stats['pii_by_category'].items():
-                pii_by_category[category] = pii_by_category.get(category, 0) + count
-
-        return {
-            'total_conversations': len(conversations),
-            'total_segments': total_segments,
-            'total_duration': total_duration,
-            'total_pii_instances': total_pii,
-            'pii_by_category': pii_by_category,
-            'avg_pii_per_conversation': total_pii / len(conversations) if conversations else 0
-        }
+            streaming_stats.update(conv)
+        return streaming_stats.finalize()
 
     def generate_qa_report(
         self,
@@ -142,65 +142,131 @@ class StatisticsGenerator:
             report: Report dictionary
             output_path: Path to save markdown report
         """
-        md_lines = [
-            "# PII De-Identification QA Report",
-            "",
-            f"**Generated:** {report['generated_at']}",
-            f"**Status:** {report['status']}",
-            "",
-            "---",
-            "",
-            "## Dataset Summary",
-            "",
-            f"- **Total Conversations:** {report['dataset_summary']['total_conversations']}",
-            f"- **Total Segments:** {report['dataset_summary']['total_segments']}",
-            f"- **Total Duration:** {report['dataset_summary']['total_duration']:.2f}s",
-            f"- **Total PII Instances Found:** {report['dataset_summary']['total_pii_instances']}",
-            f"- **Average PII per Conversation:** {report['dataset_summary']['avg_pii_per_conversation']:.1f}",
-            "",
-            "### PII by Category",
-            ""
-        ]
-
-        for category, count in report['dataset_summary']['pii_by_category'].items():
-            md_lines.append(f"- **{category.title()}:** {count}")
-
-        md_lines.extend([
-            "",
-            "---",
-            "",
-            "## Verification Results",
-            "",
-            f"- **Pass Rate:** {report['verification']['pass_rate']:.2%}",
-            f"- **PII Remaining:** {report['verification']['pii_remaining']}",
-            f"- **Failed Conversations:** {report['verification']['failed_conversations']}",
-            "",
-            "---",
-            ""
-        ])
-
-        if report['status'] == 'PASS':
-            md_lines.extend([
-                "## ✅ All Checks Passed",
-                "",
-                "No PII detected in de-identified transcripts.",
-                ""
+        summary = report['dataset_summary']
+        verification = report['verification']
+
+        # Stream lines straight to the file rather than building the report in memory
+        with open(output_path, 'w') as f:
+            f.writelines([
+                "# PII De-Identification QA Report\n",
+                "\n",
+                f"**Generated:** {report['generated_at']}\n",
+                f"**Status:** {report['status']}\n",
+                "\n",
+                "---\n",
+                "\n",
+                "## Dataset Summary\n",
+                "\n",
+                f"- **Total Conversations:** {summary['total_conversations']}\n",
+                f"- **Total Segments:** {summary['total_segments']}\n",
+                f"- **Total Duration:** {summary['total_duration']:.2f}s\n",
+                f"- **Total PII Instances Found:** {summary['total_pii_instances']}\n",
+                f"- **Average PII per Conversation:** {summary['avg_pii_per_conversation']:.1f}\n",
+                "\n",
+                "### PII by Category\n",
+                "\n"
             ])
-        else:
-            md_lines.extend([
-                "## ⚠️ Verification Failed",
-                "",
-                f"Found {report['verification']['pii_remaining']} PII instances remaining.",
-                "Review failed conversations for details.",
-                ""
+
+            f.writelines(
+                f"- **{category.title()}:** {count}\n"
+                for category, count in summary['pii_by_category'].items()
+            )
+
+            f.writelines([
+                "\n",
+                "---\n",
+                "\n",
+                "## Verification Results\n",
+                "\n",
+                f"- **Pass Rate:** {verification['pass_rate']:.2%}\n",
+                f"- **PII Remaining:** {verification['pii_remaining']}\n",
+                f"- **Failed Conversations:** {verification['failed_conversations']}\n",
+                "\n",
+                "---\n",
+                "\n"
             ])
 
-        with open(output_path, 'w') as f:
-            f.write('\n'.join(md_lines))
+            if report['status'] == 'PASS':
+                f.writelines([
+                    "## ✅ All Checks Passed\n",
+                    "\n",
+                    "No PII detected in de-identified transcripts.\n"
+                ])
+            else:
+                f.writelines([
+                    "## ⚠️ Verification Failed\n",
+                    "\n",
+                    f"Found {verification['pii_remaining']} PII instances remaining.\n",
+                    "Review failed conversations for details.\n"
+                ])
 
         logger.info(f"Markdown report saved: {output_path}")
 
 
+class StreamingStats:
+    """
+    Accumulates dataset statistics one conversation at a time.
+
+    Only running totals are kept, so conversations can be streamed from disk
+    without ever holding the whole dataset in memory.
+    """
+
+    def __init__(self, stats_generator: Optional[StatisticsGenerator] = None):
+        """
+        Initialize streaming statistics.
+
+        Args:
+            stats_generator: Generator used for per-conversation stats
+                             (a new one is created if not given)
+        """
+        self.stats_generator = stats_generator or StatisticsGenerator()
+        self.total_conversations = 0
+        self.total_segments = 0
+        self.total_duration = 0
+        self.total_pii = 0
+        self.pii_by_category = Counter()
+
+    def update(self, conversation: Dict):
+        """
+        Add one conversation to the running statistics.
+
+        Args:
+            conversation: Conversation dictionary
+        """
+        self.add(self.stats_generator.generate_conversation_stats(conversation))
+
+    def add(self, stats: Dict):
+        """
+        Add precomputed conversation statistics to the running totals.
+
+        Args:
+            stats: Statistics dictionary from generate_conversation_stats
+        """
+        self.total_conversations += 1
+        self.total_segments += stats['total_segments']
+        self.total_duration += stats['total_duration']
+        self.total_pii += stats['pii_found']
+        self.pii_by_category.update(stats['pii_by_category'])
+
+    def finalize(self) -> Dict:
+        """
+        Produce dataset statistics from the running totals.
+
+        Returns:
+            Dataset statistics dictionary (same schema as generate_dataset_stats)
+        """
+        return {
+            'total_conversations': self.total_conversations,
+            'total_segments': self.total_segments,
+            'total_duration': self.total_duration,
+            'total_pii_instances': self.total_pii,
+            'pii_by_category': dict(self.pii_by_category),
+            'avg_pii_per_conversation': (
+                self.total_pii / self.total_conversations if self.total_conversations else 0
+            )
+        }
+
+
 def main():
     """Test the statistics generator."""
     from ..utils.logger import setup_logger
@@ -1,8 +1,13 @@
 """Verify that PII has been completely removed."""
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict
-from ..deid.pii_detector import PIIDetector
+from typing import List, Dict, Optional, Tuple
+from ..deid.pii_detector import get_detector
+from .statistics import build_conversation_stats
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -11,6 +16,9 @@ logger = get_logger(__name__)
 class PIIVerifier:
     """Verifies that all PII has been removed from de-identified transcripts."""
 
+    # Texts at least this long bypass the scan cache
+    CACHE_MAX_TEXT_LEN = 4096
+
     def __init__(self, config_path: Path = Path("config.yaml")):
         """
         Initialize verifier.
@@ -18,9 +26,30 @@ class PIIVerifier:
         Args:
             config_path: Path to config.yaml file
         """
-        self.detector = PIIDetector(config_path)
+        self.config_path = Path(config_path)
+        self.detector = get_detector(config_path)
+
+        # Boilerplate segments (greetings, disclaimers) repeat across conversations,
+        # so cache scan results per instance, keyed on the text itself
+        self._scan_cached = lru_cache(maxsize=65536)(self._scan)
+
         logger.info("Initialized PIIVerifier")
 
+    def _scan(self, text: str) -> Tuple[Tuple[str, str, int], ...]:
+        """
+        Scan text for PII.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Tuple of (value, category, start) for each match
+        """
+        return tuple(
+            (m.value, m.category, m.start)
+            for m in self.detector.detect_in_text(text)
+        )
+
     def verify_text(self, text: str) -> Dict:
         """
         Verify that no PII remains in text.
@@ -31,18 +60,21 @@ class PIIVerifier:
         Returns:
             Dictionary with verification results
         """
-        matches = self.detector.detect_in_text(text)
+        if len(text) < self.CACHE_MAX_TEXT_LEN:
+            matches = self._scan_cached(text)
+        else:
+            matches = self._scan(text)
 
         return {
             'passed': len(matches) == 0,
             'pii_found': len(matches),
             'matches': [
                 {
-                    'value': m.value,
-                    'category': m.category,
-                    'position': m.start
+                    'value': value,
+                    'category': category,
+                    'position': start
                 }
-                for m in matches
+                for value, category, start in matches
             ]
         }
 
@@ -56,14 +88,29 @@ class PIIVerifier:
         Returns:
             Dictionary with verification results
         """
+        results, _ = self._scan_segments(segments)
+        return results
+
+    def _scan_segments(self, segments: List) -> Tuple[Dict, set]:
+        """
+        Verify segments and collect their speakers in a single pass.
+
+        Args:
+            segments: List of TranscriptSegment objects
+
+        Returns:
+            Tuple of (verification results, set of speakers)
+        """
         results = {
             'total_segments': len(segments),
             'failed_segments': [],
             'total_pii_found': 0,
             'passed': True
         }
+        speakers = set()
 
         for i, segment in enumerate(segments):
+            speakers.add(segment.speaker)
             verification = self.verify_text(segment.text)
 
             if not verification['passed']:
@@ -79,14 +126,78 @@ class PIIVerifier:
         logger.info(f"Verification: {results['total_pii_found']} PII instances found in "
                    f"{len(results['failed_segments'])} segments")
 
-        return results
+        return results, speakers
+
+    def verify_conversation(self, conversation: Dict) -> Dict:
+        """
+        Verify a single conversation.
+
+        Args:
+            conversation: Conversation dictionary with segments
+
+        Returns:
+            Dictionary with verification results (see verify_segments)
+        """
+        return self.verify_segments(self._to_segments(conversation))
 
-    def verify_dataset(self, conversations: List[Dict]) -> Dict:
+    def verify_and_stat(self, conversation: Dict) -> Tuple[Dict, Dict]:
+        """
+        Verify a conversation and generate its statistics in one pass over segments.
+
+        Args:
+            conversation: Conversation dictionary with segments
+
+        Returns:
+            Tuple of (verification results, conversation statistics); the
+            statistics match StatisticsGenerator.generate_conversation_stats
+        """
+        segments = self._to_segments(conversation)
+        verification, speakers = self._scan_segments(segments)
+
+        total_duration = 0
+        if segments:
+            total_duration = segments[-1].end_time or segments[-1].start_time
+
+        stats = build_conversation_stats(conversation, len(segments), total_duration, speakers)
+
+        return verification, stats
+
+    def _to_segments(self, conversation: Dict) -> List:
+        """Get a conversation's segments as TranscriptSegment objects."""
+        segments = conversation.get('segments', [])
+
+        # Convert dict segments back to objects if needed
+        from ..parsing.transcript_parser import TranscriptSegment
+        if segments and isinstance(segments[0], dict):
+            segments = [
+                TranscriptSegment(
+                    speaker=s['speaker'],
+                    text=s['text'],
+                    start_time=s['start_time'],
+                    end_time=s.get('end_time')
+                )
+                for s in segments
+            ]
+
+        return segments
+
+    def verify_dataset(
+        self,
+        conversations: List[Dict],
+        max_workers: Optional[int] = None
+    ) -> Dict:
         """
         Verify entire dataset.
 
+        Conversations are verified in a process pool since PII scanning is
+        CPU-bound and independent per conversation. Results are merged here,
+        in the parent process. Per-conversation statistics are collected in
+        the same pass and returned under 'conversation_stats'.
+
         Args:
             conversations: List of conversation dictionaries with segments
+            max_workers: Number of worker processes (None = one per CPU,
+                         0 or 1 = verify serially in this process)
 
         Returns:
             Dictionary with overall verification results
@@ -95,29 +206,50 @@ class PIIVerifier:
             'total_conversations': len(conversations),
             'failed_conversations': [],
             'total_pii_found': 0,
-            'passed': True
+            'passed': True,
+            'conversation_stats': [],
+            'failed_count': 0
         }
 
-        for conv in conversations:
-            conv_id = conv.get('conversation_id', 'unknown')
-            segments = conv.get('segments', [])
-
-            # Convert dict segments back to objects if needed
-            from ..parsing.transcript_parser import TranscriptSegment
-            if segments and isinstance(segments[0], dict):
-                segments = [
-                    TranscriptSegment(
-                        speaker=s['speaker'],
-                        text=s['text'],
-                        start_time=s['start_time'],
-                        end_time=s.get('end_time')
-                    )
-                    for s in segments
-                ]
-
-            verification = self.verify_segments(segments)
+        if max_workers in (0, 1) or len(conversations) < 2:
+            results = (
+                (conv.get('conversation_id', 'unknown'), *self.verify_and_stat(conv))
+                for conv in conversations
+            )
+            dataset_results = self._merge_results(dataset_results, results)
+
+            cache_info = self._scan_cached.cache_info()
+            logger.info(f"Verification cache: {cache_info.hits} hits, "
+                       f"{cache_info.misses} misses")
+        else:
+            num_workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(conversations) // (4 * num_workers))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(
+                    _verify_one_conv,
+                    conversations,
+                    repeat(self.config_path),
+                    chunksize=chunksize
+                )
+                dataset_results = self._merge_results(dataset_results, results)
+
+        failed_count = dataset_results.pop('failed_count')
+        pass_rate = (1.0 - failed_count / len(conversations)) if conversations else 1.0
+
+        dataset_results['pass_rate'] = pass_rate
+
+        logger.info(f"Dataset verification: {dataset_results['total_pii_found']} PII found, "
+                   f"pass rate: {pass_rate:.2%}")
+
+        return dataset_results
+
+    def _merge_results(self, dataset_results: Dict, results) -> Dict:
+        """Merge per-conversation (conversation_id, verification, stats) results into dataset results."""
+        for conv_id, verification, stats in results:
+            dataset_results['conversation_stats'].append(stats)
 
             if not verification['passed']:
+                dataset_results['failed_count'] += 1
                 dataset_results['failed_conversations'].append({
                     'conversation_id': conv_id,
                     'pii_found': verification['total_pii_found'],
@@ -126,15 +258,19 @@ class PIIVerifier:
                 dataset_results['total_pii_found'] += verification['total_pii_found']
                 dataset_results['passed'] = False
 
-        pass_rate = 1.0 - (len(dataset_results['failed_conversations']) /
-                          len(conversations) if conversations else 0)
+        return dataset_results
 
-        dataset_results['pass_rate'] = pass_rate
 
-        logger.info(f"Dataset verification: {dataset_results['total_pii_found']} PII found, "
-                   f"pass rate: {pass_rate:.2%}")
+@lru_cache(maxsize=None)
+def _get_verifier(config_path: Path) -> PIIVerifier:
+    """Get a per-process PIIVerifier so pool workers compile patterns only once."""
+    return PIIVerifier(config_path)
 
-        return dataset_results
+
+def _verify_one_conv(conversation: Dict, config_path: Path) -> Tuple[str, Dict, Dict]:
+    """Verify one conversation and generate its statistics in a pool worker."""
+    verifier = _get_verifier(config_path)
+    return (conversation.get('conversation_id', 'unknown'), *verifier.verify_and_stat(conversation))
 
 
 def main():
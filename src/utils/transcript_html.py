@@ -0,0 +1,81 @@
+"""Render de-identified transcript segments as highlighted HTML table rows."""
+
+import html
+import re
+from functools import lru_cache
+from typing import Dict
+
+# PII tag highlight colors, keyed by bare tag name
+PII_TAG_COLORS = {
+    'CITY': '#3B82F6',      # Blue
+    'STATE': '#10B981',     # Green
+    'DAY': '#F59E0B',       # Amber
+    'MONTH': '#8B5CF6',     # Purple
+    'COLOR': '#EF4444',     # Red
+}
+
+# Static header/footer for the transcript table (rows go in between)
+TRANSCRIPT_TABLE_HEAD = (
+    '<table border="1" class="dataframe"><thead><tr style="text-align: right;">'
+    '<th>Time</th><th>Speaker</th><th>Text</th></tr></thead><tbody>'
+)
+TRANSCRIPT_TABLE_TAIL = '</tbody></table>'
+
+# Highlight span HTML for each PII tag, rendered once
+_PII_SPANS = {
+    tag: (
+        f'<span style="background-color: {color}; padding: 2px 8px; border-radius: 4px; '
+        f'font-weight: 600; color: white; font-size: 0.85rem;">[{tag}]</span>'
+    )
+    for tag, color in PII_TAG_COLORS.items()
+}
+
+# Precompiled patterns for per-segment text cleanup, done in a single pass:
+# each run of whitespace and audio markup collapses to one space (or to
+# nothing if the run is only markup), and PII tags become highlight spans
+_MARKUP_OR_PII_RE = re.compile(r'((?:\s|<[^>]+>)+)|\[(' + '|'.join(PII_TAG_COLORS) + r')\]')
+_ONLY_TAGS_RE = re.compile(r'(?:<[^>]+>)+')
+_WS_RE = re.compile(r'\s+')
+
+
+def _markup_or_pii_repl(match: re.Match) -> str:
+    """Collapse whitespace/markup runs and wrap PII tags in colored HTML spans."""
+    run = match.group(1)
+    if run is None:
+        return _PII_SPANS[match.group(2)]
+    return '' if _ONLY_TAGS_RE.fullmatch(run) else ' '
+
+
+@lru_cache(maxsize=4096)
+def process_segment_text(text: str) -> str:
+    """
+    Remove audio markup tags like <cough>, <lipsmack>, etc. and highlight PII tags.
+
+    Args:
+        text: De-identified segment text
+
+    Returns:
+        Cleaned text with PII tags wrapped in colored HTML spans
+    """
+    # Most segments have neither markup nor PII tags; skip the tag pass for them
+    if '<' not in text and '[' not in text:
+        return _WS_RE.sub(' ', text).strip()
+    return _MARKUP_OR_PII_RE.sub(_markup_or_pii_repl, text).strip()
+
+
+def render_segment_row(segment: Dict) -> str:
+    """
+    Render one transcript segment as a single-line HTML table row.
+
+    Args:
+        segment: Segment dictionary with speaker, text and start_time
+
+    Returns:
+        <tr> HTML string (contains no newlines)
+    """
+    speaker = html.escape(segment.get('speaker', 'Unknown').replace('Speaker_', 'S'))
+    return (
+        f'<tr><td>{segment.get("start_time", 0):.2f}s</td>'
+        f'<td>{_WS_RE.sub(" ", speaker)}</td>'
+        f'<td>{process_segment_text(segment.get("text", ""))}</td></tr>'
+    )
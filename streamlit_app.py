@@ -7,71 +7,147 @@ Powered by Montreal Forced Aligner for word-level precision.
 
 import streamlit as st
 import json
-import re
+import os
 import io
+import math
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-import soundfile as sf
-import pandas as pd
+from typing import Dict, Optional, Tuple
+
+from src.utils.transcript_html import (
+    TRANSCRIPT_TABLE_HEAD,
+    TRANSCRIPT_TABLE_TAIL,
+    render_segment_row,
+)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 # Configuration
 OUTPUT_DIR = Path("output")
 DATA_DIR = Path("data")
 TRANSCRIPTS_DEID_DIR = OUTPUT_DIR / "transcripts_deid" / "train"
+TRANSCRIPTS_META_DIR = OUTPUT_DIR / "transcripts_deid" / "meta"
+TRANSCRIPTS_HTML_DIR = OUTPUT_DIR / "transcripts_deid" / "html"
 AUDIO_DEID_DIR = OUTPUT_DIR / "audio" / "train"
 AUDIO_RAW_DIR = DATA_DIR / "raw" / "audio"
 TRANSCRIPTS_RAW_DIR = DATA_DIR / "raw" / "transcripts"
 QA_REPORT_PATH = OUTPUT_DIR / "qa" / "qa_report.json"
 MANIFEST_PATH = OUTPUT_DIR / "metadata" / "dataset_manifest.json"
 
+# Browsers play FLAC natively, so audio is served as-is by default; set to
+# True to transcode to WAV for browsers without FLAC support
+TRANSCODE_AUDIO_TO_WAV = False
+AUDIO_MIME_TYPES = {
+    '.flac': 'audio/flac',
+    '.wav': 'audio/wav',
+}
+
+# Source subtype -> (decode dtype, WAV subtype) for the WAV transcode
+WAV_DECODE_FORMATS = {
+    'PCM_S8': ('int16', 'PCM_16'),
+    'PCM_U8': ('int16', 'PCM_16'),
+    'PCM_16': ('int16', 'PCM_16'),
+    'PCM_24': ('int32', 'PCM_24'),
+    'PCM_32': ('int32', 'PCM_32'),
+    'FLOAT': ('float32', 'FLOAT'),
+    'DOUBLE': ('float64', 'DOUBLE'),
+}
+
+# Frames per block when streaming the WAV transcode
+WAV_BLOCK_SIZE = 65536
+
+# Whole audio files kept in memory per audio cache (oldest evicted first)
+AUDIO_CACHE_MAX_ENTRIES = 8
+
+# Static page CSS
+CSS_PATH = Path(__file__).parent / "static" / "styles.css"
+
+# Transcript table rows rendered per page
+PAGE_SIZE = 50
+
 
 # Utility Functions
-def strip_markup_tags(text: str) -> str:
-    """Remove audio markup tags like <cough>, <lipsmack>, etc."""
-    clean_text = re.sub(r'<[^>]+>', '', text)
-    clean_text = re.sub(r'\s+', ' ', clean_text).strip()
-    return clean_text
-
-
-def highlight_pii_tags(text: str) -> str:
-    """Highlight PII tags with colored HTML spans."""
-    tag_colors = {
-        '[CITY]': '#3B82F6',      # Blue
-        '[STATE]': '#10B981',     # Green
-        '[DAY]': '#F59E0B',       # Amber
-        '[MONTH]': '#8B5CF6',     # Purple
-        '[COLOR]': '#EF4444',     # Red
-    }
+@st.cache_resource(show_spinner=False)
+def load_css() -> str:
+    """Load the static page CSS, wrapped in a <style> block (read once per process)."""
+    return f"<style>\n{CSS_PATH.read_text(encoding='utf-8')}</style>"
 
-    highlighted = text
-    for tag, color in tag_colors.items():
-        highlighted = highlighted.replace(
-            tag,
-            f'<span style="background-color: {color}; padding: 2px 8px; border-radius: 4px; font-weight: 600; color: white; font-size: 0.85rem;">{tag}</span>'
-        )
 
-    return highlighted
+def read_json(path: Path):
+    """Parse a JSON file, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+@st.cache_data(show_spinner=False, max_entries=AUDIO_CACHE_MAX_ENTRIES)
+def _audio_to_wav_cached(path_str: str, mtime: float) -> bytes:
+    """Decode an audio file and re-encode it as WAV (cached per path and mtime)."""
+    # WAV sources are already playable as-is
+    if path_str.lower().endswith('.wav'):
+        return Path(path_str).read_bytes()
+
+    import soundfile as sf
+
+    wav_buffer = io.BytesIO()
+    with sf.SoundFile(path_str) as fin:
+        # Decode at the source bit depth instead of soundfile's float64 default,
+        # streaming fixed-size blocks rather than materializing the whole recording
+        dtype, wav_subtype = WAV_DECODE_FORMATS.get(fin.subtype, ('int16', 'PCM_16'))
+        with sf.SoundFile(wav_buffer, 'w', samplerate=fin.samplerate, channels=fin.channels,
+                          format='WAV', subtype=wav_subtype) as fout:
+            for block in fin.blocks(blocksize=WAV_BLOCK_SIZE, dtype=dtype):
+                fout.write(block)
+    return wav_buffer.getvalue()
 
 
 def convert_audio_to_wav_bytes(audio_path: Path) -> Optional[bytes]:
     """Convert audio file (FLAC/WAV) to WAV bytes for st.audio compatibility."""
     try:
-        audio_data, sample_rate = sf.read(str(audio_path))
-        wav_buffer = io.BytesIO()
-        sf.write(wav_buffer, audio_data, sample_rate, format='WAV')
-        wav_buffer.seek(0)
-        return wav_buffer.read()
+        # mtime is part of the cache key so regenerated audio is picked up
+        return _audio_to_wav_cached(str(audio_path), audio_path.stat().st_mtime)
     except Exception as e:
         st.error(f"Audio conversion error: {e}")
         return None
 
 
+def render_audio_player(audio_path: Path) -> bool:
+    """Render an audio player for a FLAC/WAV file. Returns False if it failed to load."""
+    if TRANSCODE_AUDIO_TO_WAV:
+        wav_bytes = convert_audio_to_wav_bytes(audio_path)
+        if not wav_bytes:
+            return False
+        st.audio(wav_bytes, format='audio/wav')
+        return True
+
+    try:
+        st.audio(str(audio_path), format=AUDIO_MIME_TYPES.get(audio_path.suffix.lower(), 'audio/wav'))
+        return True
+    except Exception as e:
+        st.error(f"Audio loading error: {e}")
+        return False
+
+
+@st.cache_data(show_spinner=False)
+def _audio_duration_cached(path_str: str, mtime: float) -> float:
+    """Get audio duration in seconds (cached per path and mtime)."""
+    import soundfile as sf
+
+    # Header read only; no need to decode the samples
+    with sf.SoundFile(path_str) as audio_file:
+        return audio_file.frames / audio_file.samplerate
+
+
 def get_audio_duration(audio_path: Path) -> Optional[float]:
     """Get audio duration in seconds."""
     try:
-        audio_data, sample_rate = sf.read(str(audio_path))
-        return len(audio_data) / sample_rate
+        return _audio_duration_cached(str(audio_path), audio_path.stat().st_mtime)
     except:
         return None
 
@@ -80,9 +156,9 @@ def get_audio_duration(audio_path: Path) -> Optional[float]:
 def load_qa_report() -> Optional[Dict]:
     """Load QA report with overall statistics."""
     try:
-        if QA_REPORT_PATH.exists():
-            with open(QA_REPORT_PATH, 'r') as f:
-                return json.load(f)
+        return read_json(QA_REPORT_PATH)
+    except FileNotFoundError:
+        pass
     except Exception as e:
         st.error(f"Failed to load QA report: {e}")
     return None
@@ -92,51 +168,152 @@ def load_qa_report() -> Optional[Dict]:
 def load_manifest() -> Optional[Dict]:
     """Load dataset manifest."""
     try:
-        if MANIFEST_PATH.exists():
-            with open(MANIFEST_PATH, 'r') as f:
-                return json.load(f)
+        return read_json(MANIFEST_PATH)
     except:
         return None
 
 
-@st.cache_data
-def list_conversations() -> List[str]:
-    """List all available de-identified conversations."""
+@st.cache_data(show_spinner=False)
+def _list_conversations_cached(dir_mtime: float) -> Dict[str, str]:
+    """Map conversation IDs in the transcripts directory to display labels (cached per directory mtime)."""
+    with os.scandir(TRANSCRIPTS_DEID_DIR) as entries:
+        conv_ids = sorted(e.name[:-5] for e in entries if e.name.endswith('.json'))
+    return {conv_id: conv_id.replace("_", " ") for conv_id in conv_ids}
+
+
+def list_conversations() -> Dict[str, str]:
+    """List all available de-identified conversations, mapped to their display labels."""
     try:
-        if TRANSCRIPTS_DEID_DIR.exists():
-            json_files = sorted(TRANSCRIPTS_DEID_DIR.glob("*.json"))
-            return [f.stem for f in json_files]
+        # Directory mtime changes when transcripts are added or removed
+        return _list_conversations_cached(TRANSCRIPTS_DEID_DIR.stat().st_mtime)
+    except FileNotFoundError:
+        pass
     except Exception as e:
         st.error(f"Failed to list conversations: {e}")
-    return []
+    return {}
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _transcript_index(dir_mtime: float) -> Dict[str, Tuple[float, Dict]]:
+    """
+    Index of loaded de-identified transcripts, as (file mtime, transcript) by conversation ID.
+
+    Starts empty and is filled by load_deid_transcript. Cached per directory
+    mtime, so adding or removing transcripts drops the whole index; a
+    transcript rewritten in place (which leaves the directory mtime alone)
+    is caught by its own mtime on lookup.
+
+    Uses cache_resource so the index is shared rather than copied on every
+    access; callers must treat the returned transcripts as read-only.
+    """
+    return {}
 
 
-@st.cache_data
 def load_deid_transcript(conv_id: str) -> Optional[Dict]:
     """Load de-identified transcript JSON."""
+    transcript_path = TRANSCRIPTS_DEID_DIR / f"{conv_id}.json"
     try:
-        transcript_path = TRANSCRIPTS_DEID_DIR / f"{conv_id}.json"
-        if transcript_path.exists():
-            with open(transcript_path, 'r') as f:
-                return json.load(f)
+        index = _transcript_index(TRANSCRIPTS_DEID_DIR.stat().st_mtime)
+        mtime = transcript_path.stat().st_mtime
+        entry = index.get(conv_id)
+        if entry is None or entry[0] != mtime:
+            entry = index[conv_id] = (mtime, read_json(transcript_path))
+        return entry[1]
+    except FileNotFoundError:
+        pass
     except Exception as e:
         st.error(f"Failed to load de-identified transcript: {e}")
     return None
 
 
+@st.cache_data(show_spinner=False)
+def _meta_from_transcript_cached(conv_id: str, mtime: float) -> Optional[Dict]:
+    """Derive conversation header metadata from the full transcript (cached per transcript mtime)."""
+    deid_data = load_deid_transcript(conv_id)
+    if not deid_data:
+        return None
+
+    segments = deid_data.get('segments', [])
+    return {
+        'conversation_id': conv_id,
+        'num_segments': len(segments),
+        'num_speakers': len({seg.get('speaker', 'Unknown') for seg in segments}),
+        'total_pii_found': deid_data.get('pii_summary', {}).get('total_pii_found', 0)
+    }
+
+
+def load_deid_meta(conv_id: str) -> Optional[Dict]:
+    """Load conversation header metadata, falling back to the full transcript if no sidecar exists."""
+    try:
+        return read_json(TRANSCRIPTS_META_DIR / f"{conv_id}.json")
+    except Exception:
+        pass
+
+    try:
+        transcript_mtime = (TRANSCRIPTS_DEID_DIR / f"{conv_id}.json").stat().st_mtime
+    except FileNotFoundError:
+        return None
+    return _meta_from_transcript_cached(conv_id, transcript_mtime)
+
+
 @st.cache_data
 def load_raw_transcript(conv_id: str) -> Optional[str]:
     """Load raw transcript text."""
     try:
         raw_path = TRANSCRIPTS_RAW_DIR / f"{conv_id}.txt"
-        if raw_path.exists():
-            with open(raw_path, 'r', encoding='utf-8') as f:
-                return f.read()
+        with open(raw_path, 'r', encoding='utf-8') as f:
+            return f.read()
     except:
         pass
     return None
 
 
+@st.cache_data(show_spinner=False)
+def _render_segments_html_cached(conv_id: str, mtime: float, page: int, from_sidecar: bool) -> str:
+    """Render one page of segments as an HTML table (cached per source file mtime)."""
+    page_slice = slice((page - 1) * PAGE_SIZE, page * PAGE_SIZE)
+
+    if from_sidecar:
+        # Rows pre-rendered by the pipeline, one <tr> per line
+        rows = (TRANSCRIPTS_HTML_DIR / f"{conv_id}.html").read_text(encoding='utf-8').splitlines()[page_slice]
+    else:
+        segments = (load_deid_transcript(conv_id) or {}).get('segments', [])
+        rows = [render_segment_row(seg) for seg in segments[page_slice]]
+
+    return f'{TRANSCRIPT_TABLE_HEAD}{"".join(rows)}{TRANSCRIPT_TABLE_TAIL}'
+
+
+def render_segments_html(conv_id: str, page: int = 1) -> str:
+    """
+    Render one page of a conversation's de-identified segments as an HTML table.
+
+    Reads the pipeline's pre-rendered HTML sidecar, keyed on the sidecar's own
+    mtime; renders from the transcript JSON (keyed on its mtime) only when no
+    sidecar exists.
+    """
+    try:
+        sidecar_mtime = (TRANSCRIPTS_HTML_DIR / f"{conv_id}.html").stat().st_mtime
+        return _render_segments_html_cached(conv_id, sidecar_mtime, page, True)
+    except FileNotFoundError:
+        transcript_mtime = (TRANSCRIPTS_DEID_DIR / f"{conv_id}.json").stat().st_mtime
+        return _render_segments_html_cached(conv_id, transcript_mtime, page, False)
+
+
+@st.cache_data(show_spinner=False, max_entries=AUDIO_CACHE_MAX_ENTRIES)
+def _read_bytes_cached(path_str: str, mtime: float) -> bytes:
+    """Read a file's bytes (cached per path and mtime)."""
+    return Path(path_str).read_bytes()
+
+
+@st.cache_data(show_spinner=False)
+def _transcript_json_cached(conv_id: str, mtime: float) -> bytes:
+    """Serialize a de-identified transcript for download (cached per transcript mtime)."""
+    deid_data = load_deid_transcript(conv_id)
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(deid_data, option=orjson.OPT_INDENT_2)
+    return json.dumps(deid_data, indent=2).encode('utf-8')
+
+
 def get_audio_paths(conv_id: str) -> Tuple[Optional[Path], Optional[Path]]:
     """Get paths to original and de-identified audio files."""
     raw_wav = AUDIO_RAW_DIR / f"{conv_id}.wav"
@@ -148,6 +325,18 @@ def get_audio_paths(conv_id: str) -> Tuple[Optional[Path], Optional[Path]]:
     )
 
 
+def load_conversation_bundle(conv_id: str) -> Dict:
+    """Load everything the conversation view needs for one conversation."""
+    raw_audio, deid_audio = get_audio_paths(conv_id)
+    return {
+        'meta': load_deid_meta(conv_id),
+        'deid_data': load_deid_transcript(conv_id) or {},
+        'raw_audio': raw_audio,
+        'deid_audio': deid_audio,
+        'duration': get_audio_duration(deid_audio) if deid_audio else None
+    }
+
+
 def display_kpi_row(qa_report: Optional[Dict], manifest: Optional[Dict]):
     """Display top KPI metrics row."""
     st.markdown("### Performance Metrics")
@@ -187,23 +376,14 @@ def display_kpi_row(qa_report: Optional[Dict], manifest: Optional[Dict]):
         st.warning("Metrics not available. Run the pipeline first.")
 
 
-def display_conversation_header(conv_id: str, deid_data: Dict):
+def display_conversation_header(conv_id: str, meta: Dict, duration: Optional[float]):
     """Display conversation header card with metadata."""
     st.markdown("---")
     st.markdown(f"## {conv_id.replace('_', ' ')}")
 
     # Get metadata
-    segments = deid_data.get('segments', [])
-    pii_summary = deid_data.get('pii_summary', {})
-    total_pii = pii_summary.get('total_pii_found', 0)
-
-    # Get audio duration
-    _, deid_audio = get_audio_paths(conv_id)
-    duration = get_audio_duration(deid_audio) if deid_audio else None
-
-    # Count unique speakers
-    speakers = set(seg.get('speaker', 'Unknown') for seg in segments)
-    speaker_count = len(speakers)
+    total_pii = meta.get('total_pii_found', 0)
+    speaker_count = meta.get('num_speakers', 0)
 
     # Display metadata in columns
     col1, col2, col3, col4 = st.columns(4)
@@ -218,7 +398,7 @@ def display_conversation_header(conv_id: str, deid_data: Dict):
         st.metric("Speakers", speaker_count)
 
     with col3:
-        st.metric("Segments", len(segments))
+        st.metric("Segments", meta.get('num_segments', 0))
 
     with col4:
         if total_pii > 0:
@@ -241,26 +421,20 @@ def display_transcript_tab(conv_id: str, deid_data: Dict):
 
         segments = deid_data.get('segments', [])
         if segments:
-            table_data = []
-            for seg in segments:
-                speaker = seg.get('speaker', 'Unknown')
-                text = seg.get('text', '')
-                start_time = seg.get('start_time', 0)
-
-                clean_text = strip_markup_tags(text)
-                highlighted_text = highlight_pii_tags(clean_text)
+            # Long transcripts are rendered one page at a time
+            page = 1
+            num_pages = math.ceil(len(segments) / PAGE_SIZE)
+            if num_pages > 1:
+                page = st.number_input(
+                    f"Page (of {num_pages})", min_value=1, max_value=num_pages,
+                    value=1, key=f"transcript_page_{conv_id}"
+                )
 
-                table_data.append({
-                    "Time": f"{start_time:.2f}s",
-                    "Speaker": speaker.replace("Speaker_", "S"),
-                    "Text": highlighted_text
-                })
-
-            df = pd.DataFrame(table_data)
+            table_html = render_segments_html(conv_id, page)
 
             # Wrap table in a scrollable container
             st.markdown(
-                f'<div style="max-height: 600px; overflow-y: auto;">{df.to_html(escape=False, index=False)}</div>',
+                f'<div style="max-height: 600px; overflow-y: auto;">{table_html}</div>',
                 unsafe_allow_html=True
             )
         else:
@@ -281,17 +455,20 @@ def display_transcript_tab(conv_id: str, deid_data: Dict):
             st.info("Raw transcript not available")
 
 
-def display_audio_tab(conv_id: str, deid_data: Dict):
+def display_audio_tab(
+    conv_id: str,
+    deid_data: Dict,
+    raw_audio: Optional[Path],
+    deid_audio: Optional[Path]
+):
     """Display original and sanitized audio with download options."""
-    raw_audio, deid_audio = get_audio_paths(conv_id)
 
     # Get muted words list
     redaction_log = deid_data.get('redaction_log', {})
-    muted_words = []
-    if redaction_log.get('by_segment'):
-        for replacements in redaction_log['by_segment'].values():
-            for repl in replacements:
-                muted_words.append(repl.get('original', ''))
+    muted_words = [
+        repl.get('original', '')
+        for repl in chain.from_iterable(redaction_log.get('by_segment', {}).values())
+    ]
 
     col1, col2 = st.columns(2)
 
@@ -299,10 +476,7 @@ def display_audio_tab(conv_id: str, deid_data: Dict):
         st.markdown("#### Original Audio")
         if raw_audio:
             st.caption("Unprocessed audio file")
-            wav_bytes = convert_audio_to_wav_bytes(raw_audio)
-            if wav_bytes:
-                st.audio(wav_bytes, format='audio/wav')
-            else:
+            if not render_audio_player(raw_audio):
                 st.error("Failed to load original audio")
         else:
             st.warning("Original audio not available")
@@ -315,10 +489,7 @@ def display_audio_tab(conv_id: str, deid_data: Dict):
             else:
                 st.caption("No modifications (no PII detected)")
 
-            wav_bytes = convert_audio_to_wav_bytes(deid_audio)
-            if wav_bytes:
-                st.audio(wav_bytes, format='audio/wav')
-            else:
+            if not render_audio_player(deid_audio):
                 st.error("Failed to load sanitized audio")
         else:
             st.warning("Sanitized audio not available")
@@ -332,7 +503,7 @@ def display_audio_tab(conv_id: str, deid_data: Dict):
         if deid_data:
             st.download_button(
                 label="Download De-Identified Transcript (JSON)",
-                data=json.dumps(deid_data, indent=2),
+                data=_transcript_json_cached(conv_id, (TRANSCRIPTS_DEID_DIR / f"{conv_id}.json").stat().st_mtime),
                 file_name=f"{conv_id}_transcript.json",
                 mime="application/json",
                 use_container_width=True
@@ -342,7 +513,7 @@ def display_audio_tab(conv_id: str, deid_data: Dict):
         if deid_audio:
             st.download_button(
                 label="Download Sanitized FLAC",
-                data=open(deid_audio, 'rb').read(),
+                data=_read_bytes_cached(str(deid_audio), deid_audio.stat().st_mtime),
                 file_name=f"{conv_id}_sanitized.flac",
                 mime="audio/flac",
                 use_container_width=True
@@ -375,11 +546,11 @@ def display_pii_summary_tab(deid_data: Dict):
     categories = pii_summary.get('categories', {})
     if categories:
         st.markdown("#### PII by Category")
-        category_data = [
-            {"Category": cat.title(), "Count": count}
-            for cat, count in categories.items()
-        ]
-        st.dataframe(category_data, hide_index=True, use_container_width=True)
+        # A handful of rows: a markdown table avoids mounting the dataframe component
+        st.markdown("\n".join(
+            ["| Category | Count |", "|---|---|"] +
+            [f"| {cat.title()} | {count} |" for cat, count in categories.items()]
+        ))
 
     # Detailed redaction log
     if redaction_log.get('by_segment'):
@@ -389,19 +560,19 @@ def display_pii_summary_tab(deid_data: Dict):
         by_segment = redaction_log['by_segment']
 
         # Create table view
-        log_data = []
-        for seg_idx, replacements in by_segment.items():
-            for repl in replacements:
-                log_data.append({
-                    "Segment": seg_idx,
-                    "Original": repl.get('original', ''),
-                    "Replaced With": repl.get('tag', ''),
-                    "Category": repl.get('category', '').title()
-                })
+        log_data = [
+            {
+                "Segment": seg_idx,
+                "Original": repl.get('original', ''),
+                "Replaced With": repl.get('tag', ''),
+                "Category": repl.get('category', '').title()
+            }
+            for seg_idx, replacements in by_segment.items()
+            for repl in replacements
+        ]
 
         if log_data:
-            log_df = pd.DataFrame(log_data)
-            st.dataframe(log_df, hide_index=True, use_container_width=True)
+            st.dataframe(log_data, hide_index=True, use_container_width=True)
 
 
 def main():
@@ -413,294 +584,8 @@ def main():
         initial_sidebar_state="expanded"
     )
 
-    # GoSumo Dark Brand Aesthetic CSS - Clean & Minimal
-    st.markdown("""
-        <style>
-        /* Remove Streamlit default header and branding */
-        header[data-testid="stHeader"] {
-            display: none;
-        }
-
-        #MainMenu {visibility: hidden;}
-        footer {visibility: hidden;}
-
-        /* Global background */
-        .main {
-            background: radial-gradient(circle at top right, #1c2b63 0%, #05060f 65%, #03040a 100%);
-            padding: 2rem 3rem;
-        }
-
-        /* Typography */
-        * {
-            font-family: "Inter", "SF Pro Display", -apple-system, BlinkMacSystemFont, sans-serif;
-        }
-
-        /* Headers */
-        h1 {
-            font-size: 2.5rem;
-            color: #f3f5ff;
-            font-weight: 700;
-            letter-spacing: -0.02em;
-            margin-bottom: 0.5rem;
-        }
-
-        h2 {
-            font-size: 1.75rem;
-            color: #f3f5ff;
-            font-weight: 600;
-            margin-top: 2rem;
-            margin-bottom: 1rem;
-        }
-
-        h3 {
-            font-size: 1.125rem;
-            color: #f3f5ff;
-            font-weight: 600;
-            margin-top: 1.5rem;
-            margin-bottom: 1rem;
-        }
-
-        h4 {
-            font-size: 0.95rem;
-            color: #c5cbe3;
-            font-weight: 600;
-            margin-bottom: 0.5rem;
-        }
-
-        /* Body text */
-        p, div, span, label {
-            color: #c5cbe3;
-            line-height: 1.6;
-        }
-
-        /* Remove default Streamlit padding */
-        .block-container {
-            padding-top: 1rem;
-            max-width: 1400px;
-        }
-
-        /* Metric cards - clean and minimal */
-        [data-testid="stMetric"] {
-            background: rgba(16, 23, 47, 0.6);
-            border: 1px solid rgba(30, 42, 77, 0.5);
-            border-radius: 12px;
-            padding: 1.25rem;
-            backdrop-filter: blur(10px);
-        }
-
-        [data-testid="stMetricValue"] {
-            font-size: 2rem;
-            font-weight: 700;
-            color: #4c78ff;
-        }
-
-        [data-testid="stMetricLabel"] {
-            font-size: 0.75rem;
-            color: #9fb7ff;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.1em;
-        }
-
-        /* Tables - clean styling */
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            margin: 1.5rem 0;
-            font-size: 0.9rem;
-            background: rgba(16, 23, 47, 0.8);
-            border-radius: 8px;
-            overflow: hidden;
-        }
-
-        table thead tr {
-            background: #1b284d;
-            color: #f3f5ff;
-            text-align: left;
-            font-weight: 600;
-        }
-
-        table th, table td {
-            padding: 14px 18px;
-            border-bottom: 1px solid rgba(30, 42, 77, 0.5);
-            color: #c5cbe3;
-        }
-
-        table tbody tr:nth-of-type(odd) {
-            background: rgba(15, 22, 44, 0.4);
-        }
-
-        table tbody tr:nth-of-type(even) {
-            background: rgba(19, 28, 53, 0.4);
-        }
-
-        table tbody tr:hover {
-            background-color: rgba(27, 38, 69, 0.6);
-        }
-
-        table td:nth-child(3) {
-            max-width: 600px;
-            word-wrap: break-word;
-        }
-
-        /* Sidebar */
-        [data-testid="stSidebar"] {
-            background: linear-gradient(180deg, #0a0f1e 0%, #04050d 100%);
-            padding: 2rem 1rem;
-        }
-
-        [data-testid="stSidebar"] h1,
-        [data-testid="stSidebar"] h2,
-        [data-testid="stSidebar"] h3 {
-            color: #f3f5ff;
-        }
-
-        [data-testid="stSidebar"] a {
-            color: #9fb7ff;
-            text-decoration: none;
-            transition: color 0.2s;
-        }
-
-        [data-testid="stSidebar"] a:hover {
-            color: #4c78ff;
-            text-decoration: underline;
-        }
-
-        /* Select box */
-        [data-baseweb="select"] {
-            background: rgba(16, 23, 47, 0.8);
-            border-radius: 8px;
-        }
-
-        /* Buttons */
-        .stButton > button,
-        .stDownloadButton > button {
-            background: #4c78ff;
-            color: white;
-            border: none;
-            border-radius: 8px;
-            padding: 0.6rem 1.2rem;
-            font-weight: 600;
-            transition: all 0.2s;
-            box-shadow: 0 2px 8px rgba(76, 120, 255, 0.3);
-        }
-
-        .stButton > button:hover,
-        .stDownloadButton > button:hover {
-            background: #6b8fff;
-            box-shadow: 0 4px 16px rgba(76, 120, 255, 0.5);
-            transform: translateY(-1px);
-        }
-
-        /* Info/warning boxes */
-        [data-testid="stMarkdownContainer"] > div > div.stAlert,
-        .stInfo,
-        .stWarning {
-            background: rgba(76, 120, 255, 0.1);
-            color: #c5d3ff;
-            border-left: 3px solid #4c78ff;
-            border-radius: 6px;
-            padding: 1rem 1.25rem;
-        }
-
-        /* Tabs */
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 12px;
-            background: transparent;
-            border-bottom: 2px solid rgba(30, 42, 77, 0.5);
-            padding-bottom: 0;
-        }
-
-        .stTabs [data-baseweb="tab"] {
-            border-radius: 8px 8px 0 0;
-            color: #9fb7ff;
-            font-weight: 600;
-            padding: 12px 24px;
-            background: transparent;
-            border: none;
-        }
-
-        .stTabs [data-baseweb="tab"]:hover {
-            background: rgba(30, 47, 102, 0.3);
-            color: #c5d3ff;
-        }
-
-        .stTabs [aria-selected="true"] {
-            background: rgba(30, 47, 102, 0.6);
-            color: #f3f5ff;
-            border-bottom: 2px solid #4c78ff;
-        }
-
-        /* Dividers */
-        hr {
-            border: none;
-            border-top: 1px solid rgba(30, 42, 77, 0.5);
-            margin: 2.5rem 0;
-        }
-
-        /* Captions */
-        .caption,
-        [data-testid="stCaptionContainer"] {
-            color: #9fb7ff;
-            font-size: 0.85rem;
-        }
-
-        /* Code blocks */
-        code {
-            background: rgba(16, 23, 47, 0.8);
-            padding: 3px 8px;
-            border-radius: 4px;
-            color: #4c78ff;
-            font-family: "SF Mono", "Consolas", "Monaco", monospace;
-            font-size: 0.9em;
-        }
-
-        /* Pre blocks */
-        pre {
-            background: rgba(16, 23, 47, 0.8);
-            border-radius: 8px;
-            padding: 1rem;
-            border: 1px solid rgba(30, 42, 77, 0.5);
-        }
-
-        /* Audio players */
-        audio {
-            width: 100%;
-            margin: 0.75rem 0;
-        }
-
-        /* Expanders */
-        [data-testid="stExpander"] {
-            background: rgba(16, 23, 47, 0.6);
-            border: 1px solid rgba(30, 42, 77, 0.5);
-            border-radius: 8px;
-            margin: 0.5rem 0;
-        }
-
-        [data-testid="stExpander"] summary {
-            color: #c5cbe3;
-            font-weight: 500;
-        }
-
-        /* Dataframes */
-        [data-testid="stDataFrame"] {
-            background: rgba(16, 23, 47, 0.8);
-            border-radius: 8px;
-            overflow: hidden;
-        }
-
-        /* Text content readability */
-        [data-testid="stMarkdownContainer"] p {
-            color: #c5cbe3;
-            line-height: 1.7;
-        }
-
-        /* Column spacing */
-        [data-testid="column"] {
-            padding: 0 0.5rem;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    # Static page CSS (read from static/styles.css once per process)
+    st.markdown(load_css(), unsafe_allow_html=True)
 
     # Header
     st.title("Sonic Sanitize")
@@ -733,7 +618,7 @@ def main():
         selected_conv = st.selectbox(
             "Select Conversation",
             conversations,
-            format_func=lambda x: x.replace("_", " "),
+            format_func=conversations.__getitem__,
             label_visibility="collapsed"
         )
 
@@ -782,22 +667,35 @@ def main():
 
     # Conversation details
     if selected_conv:
-        deid_data = load_deid_transcript(selected_conv)
-
-        if deid_data:
-            # Conversation header
-            display_conversation_header(selected_conv, deid_data)
+        # Reuse the selected conversation's data across widget interactions;
+        # only one bundle is kept, replaced when the selection changes or
+        # the pipeline rewrites the transcript
+        try:
+            transcript_mtime = (TRANSCRIPTS_DEID_DIR / f"{selected_conv}.json").stat().st_mtime
+        except FileNotFoundError:
+            transcript_mtime = None
+        bundle_key = (selected_conv, transcript_mtime)
+        if st.session_state.get('conv_bundle_key') != bundle_key:
+            st.session_state.conv_bundle_key = bundle_key
+            st.session_state.conv_bundle = load_conversation_bundle(selected_conv)
+        bundle = st.session_state.conv_bundle
+
+        if bundle['meta']:
+            # Conversation header (from the metadata sidecar)
+            display_conversation_header(selected_conv, bundle['meta'], bundle['duration'])
 
             st.markdown("---")
 
-            # Tabbed interface
+            # Tabbed interface; st.tabs runs every tab body on each rerun,
+            # so all three share the bundle's transcript
+            deid_data = bundle['deid_data']
             tab1, tab2, tab3 = st.tabs(["Transcript", "Audio", "PII Summary"])
 
             with tab1:
                 display_transcript_tab(selected_conv, deid_data)
 
             with tab2:
-                display_audio_tab(selected_conv, deid_data)
+                display_audio_tab(selected_conv, deid_data, bundle['raw_audio'], bundle['deid_audio'])
 
             with tab3:
                 display_pii_summary_tab(deid_data)
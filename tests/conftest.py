@@ -0,0 +1,55 @@
+"""Shared pytest fixtures."""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Make the repo root importable (once, however many times conftest is loaded)
+ROOT = str(Path(__file__).parent.parent)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def pytest_addoption(parser):
+    """Register command-line options for the test suite."""
+    parser.addoption(
+        "--full-import-check",
+        action="store_true",
+        default=False,
+        help="Import every module in test_imports instead of only locating it"
+    )
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus):
+    """Print a one-line pass count, as the old test_modules.py runner did."""
+    passed = len(terminalreporter.stats.get("passed", []))
+    total = passed + len(terminalreporter.stats.get("failed", []))
+    terminalreporter.write_sep("=", f"RESULT: {passed}/{total} tests passed")
+
+
+@pytest.fixture(scope="session")
+def config_loader():
+    """ConfigLoader built once per test session."""
+    from src.deid.config_loader import ConfigLoader
+    return ConfigLoader()
+
+
+@pytest.fixture(scope="session")
+def detector():
+    """PIIDetector built once per test session."""
+    from src.deid.pii_detector import get_detector
+    return get_detector()
+
+
+@pytest.fixture(scope="session")
+def redactor():
+    """TextRedactor built once per test session."""
+    from src.deid.text_redactor import TextRedactor
+    return TextRedactor()
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """TranscriptParser built once per test session."""
+    from src.parsing.transcript_parser import TranscriptParser
+    return TranscriptParser()
@@ -7,7 +7,6 @@ Tests MFAAligner class with mocked MFA CLI calls and fake TextGrid files.
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock, mock_open
-import tempfile
 import subprocess
 
 from src.audio.mfa_aligner import (
@@ -54,23 +53,102 @@ item []:
             text = "test"
 """
 
+# TextGrid with silence markers and an empty interval
+SILENCE_TEXTGRID = """File type = "ooTextFile"
+Object class = "TextGrid"
+
+xmin = 0
+xmax = 2.5
+tiers? <exists>
+size = 1
+item []:
+    item [1]:
+        class = "IntervalTier"
+        name = "words"
+        xmin = 0
+        xmax = 2.5
+        intervals: size = 5
+        intervals [1]:
+            xmin = 0.0
+            xmax = 0.2
+            text = "sp"
+        intervals [2]:
+            xmin = 0.2
+            xmax = 0.7
+            text = "hello"
+        intervals [3]:
+            xmin = 0.7
+            xmax = 0.9
+            text = ""
+        intervals [4]:
+            xmin = 0.9
+            xmax = 1.4
+            text = "world"
+        intervals [5]:
+            xmin = 1.4
+            xmax = 2.5
+            text = "sil"
+"""
+
+# Pre-encoded copies for the file fixtures
+SAMPLE_TEXTGRID_BYTES: bytes = SAMPLE_TEXTGRID.encode("utf-8")
+SILENCE_TEXTGRID_BYTES: bytes = SILENCE_TEXTGRID.encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def fake_wav(tmp_path_factory):
+    """Empty WAV stub shared by alignment tests (MFA CLI is mocked)."""
+    path = tmp_path_factory.mktemp("audio") / "a.wav"
+    path.write_bytes(b"")
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def sample_textgrid(tmp_path_factory):
+    """SAMPLE_TEXTGRID written to disk once per session."""
+    path = tmp_path_factory.mktemp("textgrid") / "sample.TextGrid"
+    path.write_bytes(SAMPLE_TEXTGRID_BYTES)
+    return path
+
+
+@pytest.fixture(scope="session")
+def silence_textgrid(tmp_path_factory):
+    """SILENCE_TEXTGRID written to disk once per session."""
+    path = tmp_path_factory.mktemp("textgrid") / "silence.TextGrid"
+    path.write_bytes(SILENCE_TEXTGRID_BYTES)
+    return path
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _mfa_available():
+    """Report the MFA CLI as installed for every test in this module."""
+    with patch('shutil.which', return_value="/usr/bin/mfa"):
+        yield
+
+
+@pytest.fixture
+def aligner():
+    """MFAAligner with default settings."""
+    return MFAAligner()
+
+
+@pytest.fixture(scope="module")
+def parsed_sample_timings(_mfa_available, sample_textgrid):
+    """SAMPLE_TEXTGRID parsed once into WordTiming objects."""
+    return MFAAligner()._parse_textgrid(sample_textgrid)
+
 
 class TestMFAAligner:
     """Test suite for MFAAligner."""
 
-    @patch('shutil.which')
-    def test_mfa_not_available_raises_error(self, mock_which):
+    def test_mfa_not_available_raises_error(self):
         """Test that MFANotAvailableError is raised when MFA is not installed."""
-        mock_which.return_value = None  # MFA not found
-
-        with pytest.raises(MFANotAvailableError, match="MFA.*not found"):
-            MFAAligner()
+        with patch('shutil.which', return_value=None):  # MFA not found
+            with pytest.raises(MFANotAvailableError, match="MFA.*not found"):
+                MFAAligner()
 
-    @patch('shutil.which')
-    def test_mfa_available_initializes(self, mock_which):
+    def test_mfa_available_initializes(self):
         """Test that MFAAligner initializes successfully when MFA is available."""
-        mock_which.return_value = "/usr/bin/mfa"  # MFA found
-
         aligner = MFAAligner(
             acoustic_model="test_model",
             dictionary="test_dict"
@@ -80,88 +158,60 @@ class TestMFAAligner:
         assert aligner.dictionary == "test_dict"
         assert aligner.cleanup is True
 
-    @patch('shutil.which')
-    def test_is_mfa_available(self, mock_which):
+    def test_is_mfa_available(self):
         """Test is_mfa_available static method."""
         # MFA available
-        mock_which.return_value = "/usr/bin/mfa"
         assert MFAAligner.is_mfa_available() is True
 
         # MFA not available
-        mock_which.return_value = None
-        assert MFAAligner.is_mfa_available() is False
+        with patch('shutil.which', return_value=None):
+            assert MFAAligner.is_mfa_available() is False
 
-    @patch('shutil.which')
     @patch('subprocess.run')
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.read_text')
-    @patch('shutil.copy')
-    def test_align_success(self, mock_copy, mock_read_text, mock_exists,
-                          mock_subprocess, mock_which):
+    def test_align_success(self, mock_subprocess, aligner, fake_wav, parsed_sample_timings, tmp_path):
         """Test successful MFA alignment."""
-        # Setup mocks
-        mock_which.return_value = "/usr/bin/mfa"
-        mock_exists.return_value = True
-        mock_read_text.return_value = SAMPLE_TEXTGRID
-        mock_subprocess.return_value = MagicMock(
-            stdout="MFA alignment complete",
-            stderr="",
-            returncode=0
-        )
+        def fake_mfa_align(cmd, **kwargs):
+            # Emit the TextGrid into the output directory, as the real CLI would
+            output_dir = tmp_path / "output"
+            (output_dir / f"{Path(fake_wav).stem}.TextGrid").write_bytes(SAMPLE_TEXTGRID_BYTES)
+            return MagicMock(stdout="MFA alignment complete", stderr="", returncode=0)
 
-        # Create aligner
-        aligner = MFAAligner()
+        mock_subprocess.side_effect = fake_mfa_align
 
-        # Create temp audio file
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            audio_path = f.name
+        # Pin the aligner's working directory so the fake CLI knows where to
+        # write, independent of how the command line is laid out
+        with patch('src.audio.mfa_aligner.tempfile.TemporaryDirectory') as mock_tempdir:
+            mock_tempdir.return_value.__enter__.return_value = str(tmp_path)
 
-        try:
             # Run alignment
             word_timings = aligner.align(
-                audio_path=audio_path,
+                audio_path=fake_wav,
                 transcript_text="hello world test",
                 conversation_id="test_001"
             )
 
-            # Verify results
-            assert len(word_timings) == 3
-            assert word_timings[0].word == "hello"
-            assert word_timings[0].start_time == 0.0
-            assert word_timings[0].end_time == 0.5
-            assert word_timings[1].word == "world"
-            assert word_timings[2].word == "test"
-
-            # Verify subprocess was called
-            assert mock_subprocess.called
-            call_args = mock_subprocess.call_args[0][0]
-            assert "mfa" in call_args
-            assert "align" in call_args
-
-        finally:
-            Path(audio_path).unlink(missing_ok=True)
-
-    @patch('shutil.which')
-    def test_align_audio_not_found(self, mock_which):
-        """Test that MFAAlignmentError is raised when audio file doesn't exist."""
-        mock_which.return_value = "/usr/bin/mfa"
+        # Verify results
+        assert word_timings == parsed_sample_timings
+        assert word_timings[0].start_time == 0.0
+        assert word_timings[0].end_time == 0.5
 
-        aligner = MFAAligner()
+        # Verify subprocess was called
+        assert mock_subprocess.called
+        call_args = mock_subprocess.call_args[0][0]
+        assert "mfa" in call_args
+        assert "align" in call_args
 
+    def test_align_audio_not_found(self, aligner):
+        """Test that MFAAlignmentError is raised when audio file doesn't exist."""
         with pytest.raises(MFAAlignmentError, match="Audio file not found"):
             aligner.align(
                 audio_path="/nonexistent/audio.wav",
                 transcript_text="test"
             )
 
-    @patch('shutil.which')
     @patch('subprocess.run')
-    @patch('pathlib.Path.exists')
-    def test_align_mfa_cli_failure(self, mock_exists, mock_subprocess, mock_which):
+    def test_align_mfa_cli_failure(self, mock_subprocess, aligner, fake_wav):
         """Test that MFAAlignmentError is raised when MFA CLI fails."""
-        mock_which.return_value = "/usr/bin/mfa"
-        mock_exists.return_value = True
-
         # Mock MFA CLI failure
         mock_subprocess.side_effect = subprocess.CalledProcessError(
             returncode=1,
@@ -169,94 +219,29 @@ class TestMFAAligner:
             stderr="MFA error: alignment failed"
         )
 
-        aligner = MFAAligner()
-
-        # Create temp audio file
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            audio_path = f.name
-
-        try:
-            with pytest.raises(MFAAlignmentError, match="MFA alignment failed"):
-                aligner.align(
-                    audio_path=audio_path,
-                    transcript_text="test"
-                )
-        finally:
-            Path(audio_path).unlink(missing_ok=True)
+        with pytest.raises(MFAAlignmentError, match="MFA alignment failed"):
+            aligner.align(
+                audio_path=fake_wav,
+                transcript_text="test"
+            )
 
-    def test_parse_textgrid(self):
+    def test_parse_textgrid(self, aligner, sample_textgrid):
         """Test TextGrid parsing."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix=".TextGrid", delete=False) as f:
-            f.write(SAMPLE_TEXTGRID)
-            textgrid_path = Path(f.name)
-
-        try:
-            with patch('shutil.which', return_value="/usr/bin/mfa"):
-                aligner = MFAAligner()
-                word_timings = aligner._parse_textgrid(textgrid_path)
+        word_timings = aligner._parse_textgrid(sample_textgrid)
 
-            assert len(word_timings) == 3
-            assert word_timings[0].word == "hello"
-            assert word_timings[1].word == "world"
-            assert word_timings[2].word == "test"
+        assert len(word_timings) == 3
+        assert word_timings[0].word == "hello"
+        assert word_timings[1].word == "world"
+        assert word_timings[2].word == "test"
 
-        finally:
-            textgrid_path.unlink(missing_ok=True)
-
-    def test_parse_textgrid_with_silence(self):
+    def test_parse_textgrid_with_silence(self, aligner, silence_textgrid):
         """Test TextGrid parsing filters out silence markers."""
-        textgrid_with_silence = """File type = "ooTextFile"
-Object class = "TextGrid"
-
-xmin = 0
-xmax = 2.5
-tiers? <exists>
-size = 1
-item []:
-    item [1]:
-        class = "IntervalTier"
-        name = "words"
-        xmin = 0
-        xmax = 2.5
-        intervals: size = 5
-        intervals [1]:
-            xmin = 0.0
-            xmax = 0.2
-            text = "sp"
-        intervals [2]:
-            xmin = 0.2
-            xmax = 0.7
-            text = "hello"
-        intervals [3]:
-            xmin = 0.7
-            xmax = 0.9
-            text = ""
-        intervals [4]:
-            xmin = 0.9
-            xmax = 1.4
-            text = "world"
-        intervals [5]:
-            xmin = 1.4
-            xmax = 2.5
-            text = "sil"
-"""
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix=".TextGrid", delete=False) as f:
-            f.write(textgrid_with_silence)
-            textgrid_path = Path(f.name)
-
-        try:
-            with patch('shutil.which', return_value="/usr/bin/mfa"):
-                aligner = MFAAligner()
-                word_timings = aligner._parse_textgrid(textgrid_path)
+        word_timings = aligner._parse_textgrid(silence_textgrid)
 
-            # Should only have "hello" and "world", not sp, sil, or empty
-            assert len(word_timings) == 2
-            assert word_timings[0].word == "hello"
-            assert word_timings[1].word == "world"
-
-        finally:
-            textgrid_path.unlink(missing_ok=True)
+        # Should only have "hello" and "world", not sp, sil, or empty
+        assert len(word_timings) == 2
+        assert word_timings[0].word == "hello"
+        assert word_timings[1].word == "world"
 
     def test_word_timing_duration(self):
         """Test WordTiming duration property."""
@@ -267,11 +252,8 @@ item []:
 class TestMFAAlignerFactory:
     """Test suite for MFAAlignerFactory."""
 
-    @patch('shutil.which')
-    def test_create_from_config(self, mock_which):
+    def test_create_from_config(self):
         """Test factory creates aligner from config dict."""
-        mock_which.return_value = "/usr/bin/mfa"
-
         config = {
             'acoustic_model': 'custom_model',
             'dictionary': 'custom_dict',
@@ -286,11 +268,8 @@ class TestMFAAlignerFactory:
         assert aligner.temp_dir == Path('/tmp/mfa')
         assert aligner.cleanup is False
 
-    @patch('shutil.which')
-    def test_create_from_config_with_defaults(self, mock_which):
+    def test_create_from_config_with_defaults(self):
         """Test factory uses defaults for missing config values."""
-        mock_which.return_value = "/usr/bin/mfa"
-
         config = {}  # Empty config
 
         aligner = MFAAlignerFactory.create_from_config(config)
@@ -299,16 +278,14 @@ class TestMFAAlignerFactory:
         assert aligner.dictionary == 'english_us_arpa'
         assert aligner.cleanup is True
 
-    @patch('shutil.which')
-    def test_factory_is_available(self, mock_which):
+    def test_factory_is_available(self):
         """Test factory is_available method."""
         # MFA available
-        mock_which.return_value = "/usr/bin/mfa"
         assert MFAAlignerFactory.is_available() is True
 
         # MFA not available
-        mock_which.return_value = None
-        assert MFAAlignerFactory.is_available() is False
+        with patch('shutil.which', return_value=None):
+            assert MFAAlignerFactory.is_available() is False
 
 
 if __name__ == "__main__":
@@ -1,66 +1,34 @@
 """Test offset alignment between PII detection and forced alignment."""
 
 import pytest
-from pathlib import Path
-import sys
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.parsing.transcript_parser import TranscriptSegment
-from src.deid.pii_detector import PIIDetector
+from src.deid.pii_detector import PIIDetector, get_detector
 from src.utils.transcript_utils import prepare_full_transcript
 
 
-def test_single_segment_offset():
-    """Test that PII offsets are correct for single segment."""
-    segments = [
-        TranscriptSegment(speaker="S1", text="I'm from Dallas, Texas", start_time=0.0)
-    ]
+@pytest.mark.parametrize("text, expected_spans", [
+    ("I'm from Dallas, Texas", {("Dallas", 9, 15), ("Texas", 17, 22)}),
+    # Multi-word PII (New York is both a city and a state)
+    ("I'm from New York", {("New York", 9, 17)}),
+], ids=["dallas_texas", "new_york"])
+def test_single_segment_offset(detector, text, expected_spans):
+    """Test that PII offsets are correct for a single segment."""
+    segments = [TranscriptSegment(speaker="S1", text=text, start_time=0.0)]
 
-    detector = PIIDetector()
     matches = detector.detect_in_segments(segments)
 
-    # Should find Dallas and Texas
     assert 0 in matches, "No PII found in segment 0"
-    assert len(matches[0]) == 2, f"Expected 2 PII, got {len(matches[0])}"
-
-    # Check Dallas position (should be at char 9)
-    dallas_match = [m for m in matches[0] if m.value == "Dallas"][0]
-    assert dallas_match.start == 9, f"Dallas should start at 9, got {dallas_match.start}"
-
-    # Check Texas position (should be at char 17)
-    texas_match = [m for m in matches[0] if m.value == "Texas"][0]
-    assert texas_match.start == 17, f"Texas should start at 17, got {texas_match.start}"
-
-
-def test_multiword_pii():
-    """Test that multi-word PII (New York, San Antonio) is detected correctly."""
-    segments = [
-        TranscriptSegment(speaker="S1", text="I'm from New York", start_time=0.0)
-    ]
-
-    detector = PIIDetector()
-    matches = detector.detect_in_segments(segments)
+    assert {(m.value, m.start, m.end) for m in matches[0]} == expected_spans
 
-    assert 0 in matches, "No PII found"
-    new_york_matches = [m for m in matches[0] if "New York" in m.value]
-    assert len(new_york_matches) > 0, "New York not detected"
 
-    # New York should start at position 9
-    ny_match = new_york_matches[0]
-    assert ny_match.start == 9, f"New York should start at 9, got {ny_match.start}"
-    assert ny_match.end == 17, f"New York should end at 17, got {ny_match.end}"
-
-
-def test_cross_segment_offsets():
+def test_cross_segment_offsets(detector):
     """Test that PII offsets are global across multiple segments."""
     segments = [
         TranscriptSegment(speaker="S1", text="Hello from Dallas", start_time=0.0),
         TranscriptSegment(speaker="S2", text="I like Houston", start_time=3.0)
     ]
 
-    detector = PIIDetector()
     matches = detector.detect_in_segments(segments)
 
     # Check Dallas in segment 0
@@ -107,7 +75,7 @@ def test_transcript_preparation_consistency():
             f"Segment {i} extraction failed: expected '{segment.text}', got '{extracted}'"
 
 
-def test_complex_scenario():
+def test_complex_scenario(detector):
     """Test complex scenario with multiple PII in multiple segments."""
     segments = [
         TranscriptSegment(speaker="S1", text="I'm from Dallas, Texas on Monday", start_time=0.0),
@@ -115,7 +83,6 @@ def test_complex_scenario():
         TranscriptSegment(speaker="S1", text="San Antonio is nice on Friday", start_time=10.0)
     ]
 
-    detector = PIIDetector()
     matches = detector.detect_in_segments(segments)
 
     # Prepare full transcript for verification
@@ -133,28 +100,75 @@ def test_complex_scenario():
                 f"but found '{extracted_text}' in full text"
 
 
-def test_empty_segments():
+def test_empty_segments(detector):
     """Test handling of empty segments."""
     segments = []
 
-    detector = PIIDetector()
     matches = detector.detect_in_segments(segments)
 
     assert len(matches) == 0, "Should have no matches for empty segments"
 
 
-def test_no_pii_segments():
+def test_no_pii_segments(detector):
     """Test segments with no PII."""
     segments = [
         TranscriptSegment(speaker="S1", text="Hello there", start_time=0.0),
         TranscriptSegment(speaker="S2", text="How are you", start_time=3.0)
     ]
 
-    detector = PIIDetector()
     matches = detector.detect_in_segments(segments)
 
     assert len(matches) == 0, "Should have no matches when no PII present"
 
 
+OVERLAP_CONFIG = """
+pii_categories:
+  greetings:
+    items: [New]
+    tag: "[GREETING]"
+  cities:
+    items: [New York, York]
+    tag: "[CITY]"
+"""
+
+
+@pytest.mark.parametrize("backend", ["re", "hyperscan", "regex", "ahocorasick"])
+def test_overlapping_categories_resolve_like_combined_pattern(tmp_path, backend):
+    """Test that overlaps across categories go to the earlier category, not the longer item."""
+    if backend != "re":
+        pytest.importorskip(backend)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(OVERLAP_CONFIG)
+
+    matches = PIIDetector(config_path, backend=backend).detect_in_text("I moved to New York")
+
+    # "New" (greetings) wins over the longer "New York" (cities); "York" is still a city
+    assert [(m.category, m.value, m.start) for m in matches] == [
+        ("greetings", "New", 11),
+        ("cities", "York", 15)
+    ]
+
+
+@pytest.mark.parametrize("backend", ["hyperscan", "regex", "ahocorasick"])
+def test_backend_matches_re(detector, backend):
+    """Test that the optional regex engines report the same matches as re."""
+    pytest.importorskip(backend)
+
+    text = "New York on Monday, then San Antonio and Denver, Colorado in blue-green January"
+
+    re_matches = detector.detect_in_text(text)
+    backend_matches = PIIDetector(backend=backend).detect_in_text(text)
+
+    assert backend_matches == re_matches
+
+
+def test_get_detector_is_shared():
+    """Test that get_detector returns one instance per config path and backend."""
+    detector = get_detector("config.yaml")
+
+    assert detector is get_detector()
+    assert isinstance(detector, PIIDetector)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
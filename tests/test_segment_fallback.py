@@ -2,22 +2,50 @@
 
 import pytest
 import numpy as np
-from pathlib import Path
-import sys
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.audio.audio_modifier import AudioModifier
 from src.qa.statistics import StatisticsGenerator
 
+SAMPLE_RATE = 16000
+FADE_SAMPLES = int(0.01 * SAMPLE_RATE)  # AudioModifier default fade_duration
+# Sample range of the 0.25s-0.5s span muted by most tests
+MUTE_START = int(0.25 * SAMPLE_RATE)
+MUTE_END = int(0.5 * SAMPLE_RATE)
+
+
+def _sine(freq: float, seconds: float) -> np.ndarray:
+    """Read-only float32 sine wave at SAMPLE_RATE (shared across tests)."""
+    t = np.linspace(0, seconds, int(seconds * SAMPLE_RATE), False)
+    wave = np.sin(2 * np.pi * freq * t).astype(np.float32)
+    wave.flags.writeable = False
+    return wave
+
+
+@pytest.fixture(scope="module")
+def sine_1s():
+    """1-second mono 440 Hz sine wave."""
+    return SAMPLE_RATE, _sine(440, 1)
+
 
-def test_audio_modifier_segment_mute(tmp_path):
+@pytest.fixture(scope="module")
+def sine_2s():
+    """2-second mono 440 Hz sine wave."""
+    return SAMPLE_RATE, _sine(440, 2)
+
+
+@pytest.fixture(scope="module")
+def stereo_1s(sine_1s):
+    """1-second stereo wave: 440 Hz left, 880 Hz right."""
+    audio = np.empty((SAMPLE_RATE, 2), np.float32)
+    audio[:, 0] = sine_1s[1]
+    audio[:, 1] = _sine(880, 1)
+    audio.flags.writeable = False
+    return SAMPLE_RATE, audio
+
+
+def test_audio_modifier_segment_mute(sine_1s):
     """Verify AudioModifier.mute_segments zeroes the expected span."""
-    sample_rate = 16000
-    # 1-second mono sine wave
-    t = np.linspace(0, 1, sample_rate, False)
-    audio = np.sin(2 * np.pi * 440 * t).astype(np.float32)
+    sample_rate, audio = sine_1s
 
     modifier = AudioModifier()
     muted = modifier.mute_segments(
@@ -26,28 +54,18 @@ def test_audio_modifier_segment_mute(tmp_path):
         [{'start_time': 0.25, 'end_time': 0.5}]
     )
 
-    # Samples between 0.25s and 0.5s should become zero (accounting for fade)
-    # The fade is 0.01s by default, so check the middle of the muted region
-    start = int(0.25 * sample_rate)
-    end = int(0.5 * sample_rate)
-    fade_samples = int(0.01 * sample_rate)
-
-    # Check the center of the muted region (avoiding fade zones)
-    center_start = start + fade_samples
-    center_end = end - fade_samples
-    assert np.allclose(muted[center_start:center_end], 0.0, atol=1e-5)
+    # Samples between 0.25s and 0.5s should become zero; check the middle of
+    # the muted region, avoiding the fade zones at either end
+    assert np.abs(muted[MUTE_START + FADE_SAMPLES:MUTE_END - FADE_SAMPLES]).max() <= 1e-5
 
     # Samples outside the range remain unchanged
-    assert np.isclose(muted[0], audio[0])
-    assert np.isclose(muted[-1], audio[-1])
+    assert muted[0] == audio[0]
+    assert muted[-1] == audio[-1]
 
 
-def test_audio_modifier_multiple_segments(tmp_path):
+def test_audio_modifier_multiple_segments(sine_2s):
     """Test muting multiple non-overlapping segments."""
-    sample_rate = 16000
-    # 2-second audio
-    t = np.linspace(0, 2, 2 * sample_rate, False)
-    audio = np.sin(2 * np.pi * 440 * t).astype(np.float32)
+    sample_rate, audio = sine_2s
 
     modifier = AudioModifier()
     muted = modifier.mute_segments(
@@ -59,22 +77,18 @@ def test_audio_modifier_multiple_segments(tmp_path):
         ]
     )
 
-    fade_samples = int(0.01 * sample_rate)
-
     # Check first muted region
-    start1 = int(0.25 * sample_rate) + fade_samples
-    end1 = int(0.5 * sample_rate) - fade_samples
-    assert np.allclose(muted[start1:end1], 0.0, atol=1e-5)
+    assert np.abs(muted[MUTE_START + FADE_SAMPLES:MUTE_END - FADE_SAMPLES]).max() <= 1e-5
 
     # Check second muted region
-    start2 = int(1.0 * sample_rate) + fade_samples
-    end2 = int(1.25 * sample_rate) - fade_samples
-    assert np.allclose(muted[start2:end2], 0.0, atol=1e-5)
+    start2 = int(1.0 * sample_rate) + FADE_SAMPLES
+    end2 = int(1.25 * sample_rate) - FADE_SAMPLES
+    assert np.abs(muted[start2:end2]).max() <= 1e-5
 
     # Check unmuted region between
     between_start = int(0.6 * sample_rate)
     between_end = int(0.9 * sample_rate)
-    assert not np.allclose(muted[between_start:between_end], 0.0, atol=1e-5)
+    assert np.abs(muted[between_start:between_end]).max() > 1e-3
 
 
 def test_statistics_generator_handles_missing_end_time():
@@ -127,27 +141,20 @@ def test_statistics_generator_all_missing_end_times():
     assert stats['total_duration'] == 5.0
 
 
-def test_audio_modifier_empty_segments():
+def test_audio_modifier_empty_segments(sine_1s):
     """Test AudioModifier with no segments to mute."""
-    sample_rate = 16000
-    t = np.linspace(0, 1, sample_rate, False)
-    audio = np.sin(2 * np.pi * 440 * t).astype(np.float32)
+    sample_rate, audio = sine_1s
 
     modifier = AudioModifier()
     muted = modifier.mute_segments(audio, sample_rate, [])
 
     # Audio should be unchanged
-    assert np.allclose(muted, audio)
+    assert np.array_equal(muted, audio)
 
 
-def test_audio_modifier_stereo_audio():
+def test_audio_modifier_stereo_audio(stereo_1s):
     """Test muting on stereo audio."""
-    sample_rate = 16000
-    # 1-second stereo sine wave
-    t = np.linspace(0, 1, sample_rate, False)
-    left = np.sin(2 * np.pi * 440 * t).astype(np.float32)
-    right = np.sin(2 * np.pi * 880 * t).astype(np.float32)
-    audio = np.column_stack([left, right])
+    sample_rate, audio = stereo_1s
 
     modifier = AudioModifier()
     muted = modifier.mute_segments(
@@ -156,17 +163,16 @@ def test_audio_modifier_stereo_audio():
         [{'start_time': 0.25, 'end_time': 0.5}]
     )
 
-    fade_samples = int(0.01 * sample_rate)
-    start = int(0.25 * sample_rate) + fade_samples
-    end = int(0.5 * sample_rate) - fade_samples
+    start = MUTE_START + FADE_SAMPLES
+    end = MUTE_END - FADE_SAMPLES
 
     # Both channels should be muted
-    assert np.allclose(muted[start:end, 0], 0.0, atol=1e-5)
-    assert np.allclose(muted[start:end, 1], 0.0, atol=1e-5)
+    assert np.abs(muted[start:end, 0]).max() <= 1e-5
+    assert np.abs(muted[start:end, 1]).max() <= 1e-5
 
     # Samples outside remain unchanged
-    assert np.isclose(muted[0, 0], audio[0, 0])
-    assert np.isclose(muted[-1, 1], audio[-1, 1])
+    assert muted[0, 0] == audio[0, 0]
+    assert muted[-1, 1] == audio[-1, 1]
 
 
 if __name__ == "__main__":
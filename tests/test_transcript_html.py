@@ -0,0 +1,37 @@
+"""Test transcript HTML rendering shared by the packager and the Streamlit viewer."""
+
+import pytest
+
+from src.utils.transcript_html import process_segment_text, render_segment_row
+
+
+def test_markup_removed_and_whitespace_collapsed():
+    """Test that audio markup is dropped and whitespace runs collapse to one space."""
+    assert process_segment_text("  yeah <cough>  so\n<lipsmack> anyway ") == "yeah so anyway"
+    assert process_segment_text("well<laugh>ok") == "wellok"
+
+
+def test_pii_tags_highlighted():
+    """Test that PII tags are wrapped in highlight spans and other brackets are kept."""
+    result = process_segment_text("I'm from [CITY] on [DAY] [NAME]")
+
+    assert result.count("<span") == 2
+    assert ">[CITY]</span>" in result
+    assert ">[DAY]</span>" in result
+    assert "[NAME]" in result
+
+
+def test_segment_row_is_single_line_and_escaped():
+    """Test that rendered rows stay on one line and escape the speaker."""
+    row = render_segment_row({
+        "speaker": "Speaker_<1>",
+        "text": "hello\nthere [STATE]",
+        "start_time": 1.5
+    })
+
+    assert "\n" not in row
+    assert row.startswith("<tr><td>1.50s</td><td>S&lt;1&gt;</td>")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])